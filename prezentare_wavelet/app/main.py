@@ -13,9 +13,11 @@ import streamlit as st
 import numpy as np
 import pywt
 from PIL import Image
+import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
 import io
+from functools import lru_cache
 from pathlib import Path
 import sys
 
@@ -86,116 +88,214 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+@st.cache_data(max_entries=16, show_spinner=False)
 def create_sample_image(size=256, pattern='checkerboard'):
-    """Create sample images for demos"""
+    """Create sample images for demos (cached per size/pattern, float32)"""
     if pattern == 'checkerboard':
-        img = np.zeros((size, size))
+        # 8x8 board: block parity of row index + column index
         block = size // 8
-        for i in range(8):
-            for j in range(8):
-                if (i + j) % 2 == 0:
-                    img[i*block:(i+1)*block, j*block:(j+1)*block] = 255
-        return img
+        idx = np.arange(size) // block
+        img = np.where(((idx[:, None] + idx[None, :]) & 1) == 0, 255.0, 0.0)
     elif pattern == 'gradient':
         x = np.linspace(0, 255, size)
-        return np.tile(x, (size, 1))
+        img = np.tile(x, (size, 1))
     elif pattern == 'circles':
         y, x = np.ogrid[:size, :size]
         center = size // 2
         r = np.sqrt((x - center)**2 + (y - center)**2)
-        return (128 + 127 * np.sin(r / 10)).astype(np.uint8)
+        img = (128 + 127 * np.sin(r / 10)).astype(np.uint8)
     elif pattern == 'edges':
-        img = np.zeros((size, size))
-        img[:, size//4:3*size//4] = 255
-        img[size//4:3*size//4, :] = 255 - img[size//4:3*size//4, :]
-        return img
-    return np.random.rand(size, size) * 255
-
-
-def plot_time_frequency_comparison():
-    """Create time-frequency plane comparison figure"""
-    fig, axes = plt.subplots(1, 2, figsize=(12, 5))
-    
-    # STFT - uniform grid
-    ax = axes[0]
-    ax.set_title('STFT (Fixed Window)', fontsize=14, fontweight='bold', color='#1E88E5')
-    ax.set_xlabel('Time')
-    ax.set_ylabel('Frequency')
-    
-    # Draw uniform boxes
-    for i in range(5):
-        for j in range(5):
-            rect = Rectangle((i*0.2, j*0.2), 0.18, 0.18, 
-                            linewidth=2, edgecolor='#1E88E5', 
-                            facecolor='#BBDEFB', alpha=0.7)
-            ax.add_patch(rect)
-    ax.set_xlim(0, 1)
-    ax.set_ylim(0, 1)
-    ax.set_aspect('equal')
-    
-    # Wavelet - adaptive grid
-    ax = axes[1]
-    ax.set_title('Wavelet (Adaptive Windows)', fontsize=14, fontweight='bold', color='#4CAF50')
-    ax.set_xlabel('Time')
-    ax.set_ylabel('Frequency')
-    
-    # Low frequency - wide in time
-    for i in range(2):
-        rect = Rectangle((i*0.5, 0), 0.48, 0.15, 
-                        linewidth=2, edgecolor='#4CAF50', 
-                        facecolor='#C8E6C9', alpha=0.7)
-        ax.add_patch(rect)
-    
-    # Mid frequency
-    for i in range(4):
-        rect = Rectangle((i*0.25, 0.2), 0.23, 0.25, 
-                        linewidth=2, edgecolor='#4CAF50', 
-                        facecolor='#C8E6C9', alpha=0.7)
-        ax.add_patch(rect)
-    
-    # High frequency - narrow in time
-    for i in range(8):
-        rect = Rectangle((i*0.125, 0.5), 0.12, 0.45, 
-                        linewidth=2, edgecolor='#4CAF50', 
-                        facecolor='#C8E6C9', alpha=0.7)
-        ax.add_patch(rect)
-    
-    ax.set_xlim(0, 1)
-    ax.set_ylim(0, 1)
-    ax.set_aspect('equal')
-    
-    plt.tight_layout()
-    return fig
+        # Vertical band XOR horizontal band
+        band = np.zeros(size, dtype=bool)
+        band[size//4:3*size//4] = True
+        img = np.where(band[:, None] ^ band[None, :], 255.0, 0.0)
+    else:
+        img = np.random.rand(size, size) * 255
+    return img.astype(np.float32)
 
 
-def plot_wavelet_family(wavelet_name='db4'):
-    """Plot wavelet and scaling functions"""
-    try:
-        wavelet = pywt.Wavelet(wavelet_name)
-        phi, psi, x = wavelet.wavefun(level=8)
+@st.cache_data(max_entries=4, show_spinner=False)
+def _decode_image(data: bytes):
+    """Decode image bytes to a grayscale uint8 array of at most 512 px (once per upload)"""
+    img = Image.open(io.BytesIO(data))
+    # JPEG: let libjpeg decode at a reduced scale instead of full resolution
+    img.draft('L', (512, 512))
+    img = img.convert('L')
+    img.thumbnail((512, 512), Image.BILINEAR)
+    return np.asarray(img)
+
+
+def load_image_from_upload(uploaded):
+    """Load an uploaded file as a grayscale float32 array"""
+    return _decode_image(uploaded.getvalue()).astype(np.float32, copy=False)
+
+
+@st.cache_resource(show_spinner=False)
+def plot_time_frequency_comparison(style='default'):
+    """Create time-frequency plane comparison figure (built once per plot style)"""
+    with plt.style.context(style):
+        fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+        
+        # STFT - uniform grid
+        ax = axes[0]
+        ax.set_title('STFT (Fixed Window)', fontsize=14, fontweight='bold', color='#1E88E5')
+        ax.set_xlabel('Time')
+        ax.set_ylabel('Frequency')
+        
+        # Draw uniform boxes
+        for i in range(5):
+            for j in range(5):
+                rect = Rectangle((i*0.2, j*0.2), 0.18, 0.18, 
+                                linewidth=2, edgecolor='#1E88E5', 
+                                facecolor='#BBDEFB', alpha=0.7)
+                ax.add_patch(rect)
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        ax.set_aspect('equal')
+        
+        # Wavelet - adaptive grid
+        ax = axes[1]
+        ax.set_title('Wavelet (Adaptive Windows)', fontsize=14, fontweight='bold', color='#4CAF50')
+        ax.set_xlabel('Time')
+        ax.set_ylabel('Frequency')
+        
+        # Low frequency - wide in time
+        for i in range(2):
+            rect = Rectangle((i*0.5, 0), 0.48, 0.15, 
+                            linewidth=2, edgecolor='#4CAF50', 
+                            facecolor='#C8E6C9', alpha=0.7)
+            ax.add_patch(rect)
         
-        fig, axes = plt.subplots(1, 2, figsize=(12, 4))
+        # Mid frequency
+        for i in range(4):
+            rect = Rectangle((i*0.25, 0.2), 0.23, 0.25, 
+                            linewidth=2, edgecolor='#4CAF50', 
+                            facecolor='#C8E6C9', alpha=0.7)
+            ax.add_patch(rect)
         
-        axes[0].plot(x, phi, 'b-', linewidth=2)
-        axes[0].fill_between(x, phi, alpha=0.3)
-        axes[0].set_title(f'Scaling Function φ(t) - {wavelet_name}', fontsize=12)
-        axes[0].set_xlabel('t')
-        axes[0].grid(True, alpha=0.3)
+        # High frequency - narrow in time
+        for i in range(8):
+            rect = Rectangle((i*0.125, 0.5), 0.12, 0.45, 
+                            linewidth=2, edgecolor='#4CAF50', 
+                            facecolor='#C8E6C9', alpha=0.7)
+            ax.add_patch(rect)
         
-        axes[1].plot(x, psi, 'r-', linewidth=2)
-        axes[1].fill_between(x, psi, alpha=0.3, color='red')
-        axes[1].set_title(f'Wavelet Function ψ(t) - {wavelet_name}', fontsize=12)
-        axes[1].set_xlabel('t')
-        axes[1].grid(True, alpha=0.3)
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        ax.set_aspect('equal')
         
         plt.tight_layout()
+    # Detach from pyplot so the cached figure survives plt.close() calls
+    plt.close(fig)
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def time_frequency_png(style='default'):
+    """Render the static time-frequency figure to PNG once per plot style"""
+    buf = io.BytesIO()
+    plot_time_frequency_comparison(style).savefig(buf, format='png', bbox_inches='tight', dpi=150)
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=32)
+def _get_wavelet(name):
+    """Build each pywt.Wavelet (filter bank) once and reuse it"""
+    return pywt.Wavelet(name)
+
+
+@st.cache_resource(show_spinner=False)
+def plot_wavelet_family(wavelet_name='db4', style='default'):
+    """Plot wavelet and scaling functions (built once per wavelet and plot style)"""
+    try:
+        wavelet = _get_wavelet(wavelet_name)
+        phi, psi, x = wavelet.wavefun(level=8)
+        
+        with plt.style.context(style):
+            fig, axes = plt.subplots(1, 2, figsize=(12, 4))
+            
+            axes[0].plot(x, phi, 'b-', linewidth=2)
+            axes[0].fill_between(x, phi, alpha=0.3)
+            axes[0].set_title(f'Scaling Function φ(t) - {wavelet_name}', fontsize=12)
+            axes[0].set_xlabel('t')
+            axes[0].grid(True, alpha=0.3)
+            
+            axes[1].plot(x, psi, 'r-', linewidth=2)
+            axes[1].fill_between(x, psi, alpha=0.3, color='red')
+            axes[1].set_title(f'Wavelet Function ψ(t) - {wavelet_name}', fontsize=12)
+            axes[1].set_xlabel('t')
+            axes[1].grid(True, alpha=0.3)
+            
+            plt.tight_layout()
+        plt.close(fig)
         return fig
     except:
         return None
 
 
+def normalize_for_display(arr):
+    """Normalize array to uint8 0-255 for st.image"""
+    lo, hi = arr.min(), arr.max()
+    if hi == lo:
+        return np.zeros(arr.shape, dtype=np.uint8)
+    return ((arr - lo) * (255.0 / (hi - lo))).astype(np.uint8)
+
+
+def to_uint8(arr, vmin=None, vmax=None):
+    """Map an array to uint8, over a fixed [vmin, vmax] range or its own min/max"""
+    if vmin is None:
+        return normalize_for_display(arr)
+    return ((np.clip(arr, vmin, vmax) - vmin) * (255.0 / (vmax - vmin))).astype(np.uint8)
+
+
+def make_preview(arr, width=400, vmin=None, vmax=None, cmap=None):
+    """Downscale an array to a uint8 PIL preview for st.image"""
+    img = to_uint8(arr, vmin, vmax)
+    if cmap is not None:
+        img = matplotlib.colormaps[cmap](img, bytes=True)[..., :3]
+    h, w = img.shape[:2]
+    return Image.fromarray(img).resize((width, max(1, width * h // w)), Image.BILINEAR)
+
+
+def panel_strip(panels, height=400):
+    """Join uint8 panels side by side at a common height (one st.image payload)"""
+    resized = [
+        np.asarray(Image.fromarray(p).resize(
+            (max(1, height * p.shape[1] // p.shape[0]), height), Image.BILINEAR))
+        for p in panels
+    ]
+    return np.concatenate(resized, axis=1)
+
+
+def haar_wavedec2(image, level=1):
+    """
+    Haar DWT via pairwise sums/differences (same layout and signs as pywt.wavedec2).
+    
+    Requires both image sides to be divisible by 2**level.
+    """
+    a = np.asarray(image, dtype=np.float32)
+    details = []
+    for _ in range(level):
+        lo = a[:, 0::2] + a[:, 1::2]
+        hi = a[:, 0::2] - a[:, 1::2]
+        ll = lo[0::2] + lo[1::2]
+        lh = lo[0::2] - lo[1::2]
+        hl = hi[0::2] + hi[1::2]
+        hh = hi[0::2] - hi[1::2]
+        for band in (ll, lh, hl, hh):
+            band *= np.float32(0.5)
+        details.append((lh, hl, hh))
+        a = ll
+    return [a] + details[::-1]
+
+
 def perform_dwt2d(image, wavelet='db4', level=1):
     """Perform 2D DWT and return coefficients"""
+    step = 1 << level
+    if wavelet == 'haar' and image.shape[0] % step == 0 and image.shape[1] % step == 0:
+        # Fast path for the common Haar demo case
+        return haar_wavedec2(image, level)
+    wavelet = _get_wavelet(wavelet)
     coeffs = pywt.wavedec2(image, wavelet, level=level)
     return coeffs
 
@@ -205,42 +305,68 @@ def create_subband_visualization(coeffs):
     # Get the approximation and detail coefficients
     arr, coeff_slices = pywt.coeffs_to_array(coeffs)
     
-    # Normalize for display
-    arr_norm = arr.copy()
-    arr_norm = (arr_norm - arr_norm.min()) / (arr_norm.max() - arr_norm.min() + 1e-10)
+    # Normalize for display in place (coeffs_to_array already returns a fresh array)
+    lo, hi = arr.min(), arr.max()
+    np.subtract(arr, lo, out=arr)
+    np.multiply(arr, 1.0 / (hi - lo + 1e-10), out=arr)
     
-    return arr_norm, coeff_slices
+    return arr, coeff_slices
+
+
+def threshold_inplace(arr, threshold, mode='soft'):
+    """Soft/hard threshold a coefficient array in place (same rule as pywt.threshold)"""
+    mag = np.abs(arr)
+    if mode == 'hard':
+        arr[mag < threshold] = 0
+    else:
+        np.subtract(mag, threshold, out=mag)
+        np.maximum(mag, 0, out=mag)
+        np.copysign(mag, arr, out=arr)
+    return arr
 
 
+@st.cache_data(max_entries=64, show_spinner=False)
 def wavelet_denoise(image, wavelet='db4', level=4, threshold=None, mode='soft'):
-    """Denoise image using wavelet thresholding"""
-    coeffs = pywt.wavedec2(image, wavelet, level=level)
+    """Denoise image using wavelet thresholding (cached per image and parameters)"""
+    image = np.ascontiguousarray(image, dtype=np.float32)
+    wavelet = _get_wavelet(wavelet)
+    coeffs = pywt.wavedecn(image, wavelet, level=level, axes=(-2, -1))
+    arr, slices = pywt.coeffs_to_array(coeffs, axes=(-2, -1))
     
     # Estimate noise from HH subband at finest level
-    sigma = np.median(np.abs(coeffs[-1][2])) / 0.6745
+    sigma = np.median(np.abs(arr[slices[-1]['dd']])) / 0.6745
     
     if threshold is None:
         # Universal threshold
         threshold = sigma * np.sqrt(2 * np.log(image.size))
     
-    # Threshold detail coefficients
-    new_coeffs = [coeffs[0]]  # Keep approximation
-    for detail_level in coeffs[1:]:
-        new_detail = tuple(
-            pywt.threshold(c, threshold, mode=mode) 
-            for c in detail_level
-        )
-        new_coeffs.append(new_detail)
+    # Threshold all detail coefficients in one pass, keeping the approximation
+    approx = arr[slices[0]].copy()
+    threshold_inplace(arr, threshold, mode)
+    arr[slices[0]] = approx
     
     # Reconstruct
-    denoised = pywt.waverec2(new_coeffs, wavelet)
+    new_coeffs = pywt.array_to_coeffs(arr, slices, output_format='wavedecn')
+    denoised = pywt.waverecn(new_coeffs, wavelet, axes=(-2, -1))
     return np.clip(denoised[:image.shape[0], :image.shape[1]], 0, 255), sigma, threshold
 
 
+@st.cache_data(show_spinner=False)
+def compression_coeffs(pattern='edges', wavelet='bior4.4', level=4):
+    """Decompose the compression demo image once (the slider only re-thresholds)"""
+    img = create_sample_image(256, pattern)
+    coeffs = pywt.wavedec2(img, _get_wavelet(wavelet), level=level)
+    arr, slices = pywt.coeffs_to_array(coeffs)
+    return img, arr, slices
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
 def add_noise(image, sigma=25):
-    """Add Gaussian noise to image"""
-    noisy = image + np.random.normal(0, sigma, image.shape)
-    return np.clip(noisy, 0, 255)
+    """Add Gaussian noise to image (fixed seed, so the noise is stable across reruns)"""
+    rng = np.random.default_rng(42)
+    noise = rng.standard_normal(image.shape, dtype=np.float32)
+    noise *= np.float32(sigma)
+    return np.clip(image + noise, 0, 255)
 
 
 # ============================================================================
@@ -260,10 +386,8 @@ with st.sidebar:
     st.markdown("### ⚙️ Settings")
     dark_mode = st.checkbox("Dark plots", value=False)
     
-    if dark_mode:
-        plt.style.use('dark_background')
-    else:
-        plt.style.use('default')
+    plot_style = 'dark_background' if dark_mode else 'default'
+    plt.style.use(plot_style)
 
 # ============================================================================
 # HOME PAGE
@@ -306,9 +430,10 @@ if page == "🏠 Home":
     
     col1, col2 = st.columns(2)
     with col1:
-        st.image(demo_image / 255, caption="Original Image", use_container_width=True)
+        st.image(demo_image.astype(np.uint8), caption="Original Image", use_container_width=True)
     with col2:
-        st.image(arr_norm, caption="Wavelet Decomposition (2 levels)", use_container_width=True)
+        st.image((arr_norm * 255).astype(np.uint8), caption="Wavelet Decomposition (2 levels)",
+                 use_container_width=True)
 
 # ============================================================================
 # TIME-FREQUENCY PAGE
@@ -317,9 +442,7 @@ elif page == "📊 Time-Frequency":
     st.markdown('<div class="slide-title">📊 Fourier vs Wavelet: Time-Frequency Resolution</div>', unsafe_allow_html=True)
     
     # Comparison figure
-    fig = plot_time_frequency_comparison()
-    st.pyplot(fig)
-    plt.close()
+    st.image(time_frequency_png(plot_style), use_container_width=True)
     
     st.markdown("---")
     
@@ -372,10 +495,9 @@ elif page == "📊 Time-Frequency":
         index=1
     )
     
-    fig = plot_wavelet_family(wavelet_choice)
+    fig = plot_wavelet_family(wavelet_choice, plot_style)
     if fig:
         st.pyplot(fig)
-        plt.close()
 
 # ============================================================================
 # MALLAT DWT PAGE
@@ -383,51 +505,45 @@ elif page == "📊 Time-Frequency":
 elif page == "🔲 Mallat DWT":
     st.markdown('<div class="slide-title">🔲 Mallat 2D Wavelet Decomposition</div>', unsafe_allow_html=True)
     
-    col1, col2 = st.columns([1, 2])
-    
-    with col1:
-        st.markdown("### Settings")
-        
-        image_source = st.radio("Image source:", ["Sample", "Upload"])
-        
-        if image_source == "Sample":
-            pattern = st.selectbox("Pattern:", ['circles', 'checkerboard', 'gradient', 'edges'])
-            size = st.slider("Size:", 128, 512, 256, 64)
-            image = create_sample_image(size, pattern)
-        else:
-            uploaded = st.file_uploader("Upload image:", type=['png', 'jpg', 'jpeg'])
-            if uploaded:
-                img = Image.open(uploaded).convert('L')
-                image = np.array(img, dtype=np.float64)
+    @st.fragment
+    def mallat_panel():
+        """Settings and decomposition (reruns on its own when a setting changes)"""
+        col1, col2 = st.columns([1, 2])
+        
+        with col1:
+            st.markdown("### Settings")
+            
+            image_source = st.radio("Image source:", ["Sample", "Upload"])
+            
+            if image_source == "Sample":
+                pattern = st.selectbox("Pattern:", ['circles', 'checkerboard', 'gradient', 'edges'])
+                size = st.slider("Size:", 128, 512, 256, 64)
+                image = create_sample_image(size, pattern)
             else:
-                image = create_sample_image(256, 'circles')
-        
-        wavelet = st.selectbox("Wavelet:", ['haar', 'db4', 'db8', 'bior2.2', 'bior4.4'], index=0)
-        levels = st.slider("Decomposition levels:", 1, 5, 2)
-    
-    with col2:
-        # Perform DWT
-        coeffs = perform_dwt2d(image, wavelet, levels)
-        arr_norm, coeff_slices = create_subband_visualization(coeffs)
-        
-        fig, axes = plt.subplots(1, 3, figsize=(15, 5))
-        
-        axes[0].imshow(image, cmap='gray')
-        axes[0].set_title('Original', fontsize=12)
-        axes[0].axis('off')
-        
-        axes[1].imshow(arr_norm, cmap='gray')
-        axes[1].set_title(f'DWT ({wavelet}, {levels} levels)', fontsize=12)
-        axes[1].axis('off')
-        
-        # Show LL approximation
-        axes[2].imshow(coeffs[0], cmap='gray')
-        axes[2].set_title('LL (Approximation)', fontsize=12)
-        axes[2].axis('off')
-        
-        plt.tight_layout()
-        st.pyplot(fig)
-        plt.close()
+                uploaded = st.file_uploader("Upload image:", type=['png', 'jpg', 'jpeg'])
+                if uploaded:
+                    image = load_image_from_upload(uploaded)
+                else:
+                    image = create_sample_image(256, 'circles')
+            
+            wavelet = st.selectbox("Wavelet:", ['haar', 'db4', 'db8', 'bior2.2', 'bior4.4'], index=0)
+            levels = st.slider("Decomposition levels:", 1, 5, 2)
+        
+        with col2:
+            # Perform DWT
+            coeffs = perform_dwt2d(image, wavelet, levels)
+            arr_norm, coeff_slices = create_subband_visualization(coeffs)
+            
+            # Original | DWT | LL approximation, sent as one image
+            panel = panel_strip([
+                normalize_for_display(image),
+                (arr_norm * 255).astype(np.uint8),
+                normalize_for_display(coeffs[0]),
+            ], height=256)
+            st.image(panel, caption=f'Original | DWT ({wavelet}, {levels} levels) | LL (Approximation)',
+                     use_container_width=True)
+    
+    mallat_panel()
     
     st.markdown("---")
     
@@ -469,71 +585,69 @@ elif page == "🔲 Mallat DWT":
 elif page == "🔇 Denoising":
     st.markdown('<div class="slide-title">🔇 Wavelet Denoising</div>', unsafe_allow_html=True)
     
-    col1, col2 = st.columns([1, 2])
-    
-    with col1:
-        st.markdown("### Parameters")
-        
-        # Create or upload image
-        use_upload = st.checkbox("Upload custom image")
-        
-        if use_upload:
-            uploaded = st.file_uploader("Upload:", type=['png', 'jpg', 'jpeg'])
-            if uploaded:
-                original = np.array(Image.open(uploaded).convert('L'), dtype=np.float64)
+    @st.fragment
+    def denoise_panel():
+        """Parameters and results (reruns on its own when a parameter changes)"""
+        col1, col2 = st.columns([1, 2])
+        
+        with col1:
+            st.markdown("### Parameters")
+            
+            # Create or upload image
+            use_upload = st.checkbox("Upload custom image")
+            
+            if use_upload:
+                uploaded = st.file_uploader("Upload:", type=['png', 'jpg', 'jpeg'])
+                if uploaded:
+                    original = load_image_from_upload(uploaded)
+                else:
+                    original = create_sample_image(256, 'circles')
             else:
                 original = create_sample_image(256, 'circles')
-        else:
-            original = create_sample_image(256, 'circles')
-        
-        noise_sigma = st.slider("Noise level (σ):", 5, 100, 30)
-        wavelet = st.selectbox("Wavelet:", ['db4', 'db8', 'sym4', 'bior4.4'], key='denoise_wavelet')
-        levels = st.slider("DWT levels:", 2, 6, 4, key='denoise_levels')
-        threshold_mode = st.radio("Threshold mode:", ['soft', 'hard'], horizontal=True)
-        
-        auto_threshold = st.checkbox("Auto threshold (Universal)", value=True)
-        if not auto_threshold:
-            manual_threshold = st.slider("Manual threshold:", 1.0, 200.0, 50.0)
-        else:
-            manual_threshold = None
-    
-    with col2:
-        # Add noise
-        noisy = add_noise(original, noise_sigma)
-        
-        # Denoise
-        denoised, estimated_sigma, used_threshold = wavelet_denoise(
-            noisy, wavelet, levels, manual_threshold, threshold_mode
-        )
-        
-        # Calculate metrics
-        mse_noisy = np.mean((original - noisy)**2)
-        mse_denoised = np.mean((original - denoised)**2)
-        psnr_noisy = 10 * np.log10(255**2 / mse_noisy) if mse_noisy > 0 else float('inf')
-        psnr_denoised = 10 * np.log10(255**2 / mse_denoised) if mse_denoised > 0 else float('inf')
-        
-        # Display
-        fig, axes = plt.subplots(1, 3, figsize=(15, 5))
-        
-        axes[0].imshow(original, cmap='gray', vmin=0, vmax=255)
-        axes[0].set_title('Original', fontsize=12)
-        axes[0].axis('off')
-        
-        axes[1].imshow(noisy, cmap='gray', vmin=0, vmax=255)
-        axes[1].set_title(f'Noisy (PSNR: {psnr_noisy:.1f} dB)', fontsize=12)
-        axes[1].axis('off')
-        
-        axes[2].imshow(denoised, cmap='gray', vmin=0, vmax=255)
-        axes[2].set_title(f'Denoised (PSNR: {psnr_denoised:.1f} dB)', fontsize=12)
-        axes[2].axis('off')
-        
-        plt.tight_layout()
-        st.pyplot(fig)
-        plt.close()
-        
-        # Metrics
-        improvement = psnr_denoised - psnr_noisy
-        st.success(f"✅ PSNR improvement: **+{improvement:.1f} dB** | Threshold: {used_threshold:.1f} | Est. σ: {estimated_sigma:.1f}")
+            
+            noise_sigma = st.slider("Noise level (σ):", 5, 100, 30)
+            wavelet = st.selectbox("Wavelet:", ['db4', 'db8', 'sym4', 'bior4.4'], key='denoise_wavelet')
+            levels = st.slider("DWT levels:", 2, 6, 4, key='denoise_levels')
+            threshold_mode = st.radio("Threshold mode:", ['soft', 'hard'], horizontal=True)
+            
+            auto_threshold = st.checkbox("Auto threshold (Universal)", value=True)
+            if not auto_threshold:
+                manual_threshold = st.slider("Manual threshold:", 1.0, 200.0, 50.0)
+            else:
+                manual_threshold = None
+        
+        with col2:
+            # Add noise
+            noisy = add_noise(original, noise_sigma)
+            
+            # Denoise
+            denoised, estimated_sigma, used_threshold = wavelet_denoise(
+                noisy, wavelet, levels, manual_threshold, threshold_mode
+            )
+            
+            # Calculate metrics
+            # Accumulate errors in float64 to keep high PSNR values accurate
+            reference = original.astype(np.float64)
+            mse_noisy = np.mean((reference - noisy)**2)
+            mse_denoised = np.mean((reference - denoised)**2)
+            psnr_noisy = 10 * np.log10(255**2 / mse_noisy) if mse_noisy > 0 else float('inf')
+            psnr_denoised = 10 * np.log10(255**2 / mse_denoised) if mse_denoised > 0 else float('inf')
+            
+            # Display
+            panel = panel_strip([
+                to_uint8(original, 0, 255),
+                to_uint8(noisy, 0, 255),
+                to_uint8(denoised, 0, 255),
+            ])
+            st.image(panel, caption=f'Original | Noisy (PSNR {psnr_noisy:.1f} dB) | '
+                                    f'Denoised (PSNR {psnr_denoised:.1f} dB)',
+                     use_container_width=True)
+            
+            # Metrics
+            improvement = psnr_denoised - psnr_noisy
+            st.success(f"✅ PSNR improvement: **+{improvement:.1f} dB** | Threshold: {used_threshold:.1f} | Est. σ: {estimated_sigma:.1f}")
+    
+    denoise_panel()
 
     st.markdown("---")
     
@@ -605,47 +719,43 @@ elif page == "🖼️ Compression":
     # Interactive compression demo
     st.markdown("### 🎚️ Compression Demo")
     
-    original = create_sample_image(256, 'edges')
-    
-    compression = st.slider("Compression level (% coefficients kept):", 1, 100, 50)
-    
-    # Wavelet compression simulation
-    coeffs = pywt.wavedec2(original, 'bior4.4', level=4)
-    arr, slices = pywt.coeffs_to_array(coeffs)
-    
-    # Keep only top % coefficients
-    threshold = np.percentile(np.abs(arr), 100 - compression)
-    arr_compressed = np.where(np.abs(arr) >= threshold, arr, 0)
-    
-    coeffs_compressed = pywt.array_to_coeffs(arr_compressed, slices, output_format='wavedec2')
-    reconstructed = pywt.waverec2(coeffs_compressed, 'bior4.4')
-    reconstructed = np.clip(reconstructed[:256, :256], 0, 255)
-    
-    # Calculate metrics
-    mse = np.mean((original - reconstructed)**2)
-    psnr = 10 * np.log10(255**2 / mse) if mse > 0 else float('inf')
-    nonzero = np.count_nonzero(arr_compressed)
-    total = arr.size
-    
-    fig, axes = plt.subplots(1, 3, figsize=(15, 5))
-    
-    axes[0].imshow(original, cmap='gray')
-    axes[0].set_title('Original', fontsize=12)
-    axes[0].axis('off')
-    
-    axes[1].imshow(np.abs(arr_compressed), cmap='hot')
-    axes[1].set_title(f'Coefficients ({nonzero}/{total} = {100*nonzero/total:.1f}%)', fontsize=12)
-    axes[1].axis('off')
-    
-    axes[2].imshow(reconstructed, cmap='gray')
-    axes[2].set_title(f'Reconstructed (PSNR: {psnr:.1f} dB)', fontsize=12)
-    axes[2].axis('off')
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    @st.fragment
+    def compression_demo():
+        """Slider and reconstruction (reruns on its own when the slider moves)"""
+        original, arr, slices = compression_coeffs()
+        
+        compression = st.slider("Compression level (% coefficients kept):", 1, 100, 50)
+        
+        # Wavelet compression simulation
+        # Keep only top % coefficients (O(N) selection of the k-th largest magnitude)
+        k = int(arr.size * compression / 100)
+        abs_arr = np.abs(arr)
+        threshold = np.partition(abs_arr, arr.size - k, axis=None)[arr.size - k] if k > 0 else np.inf
+        arr_compressed = np.where(abs_arr >= threshold, arr, 0)
+        
+        coeffs_compressed = pywt.array_to_coeffs(arr_compressed, slices, output_format='wavedec2')
+        reconstructed = pywt.waverec2(coeffs_compressed, _get_wavelet('bior4.4'))
+        reconstructed = np.clip(reconstructed[:256, :256], 0, 255)
+        
+        # Calculate metrics
+        mse = np.mean((original.astype(np.float64) - reconstructed)**2)
+        psnr = 10 * np.log10(255**2 / mse) if mse > 0 else float('inf')
+        nonzero = np.count_nonzero(arr_compressed)
+        total = arr.size
+        
+        st.image(
+            [make_preview(original),
+             make_preview(np.abs(arr_compressed), cmap='hot'),
+             make_preview(reconstructed)],
+            caption=['Original',
+                     f'Coefficients ({nonzero}/{total} = {100*nonzero/total:.1f}%)',
+                     f'Reconstructed (PSNR: {psnr:.1f} dB)'],
+            width=400
+        )
+        
+        st.info(f"💾 Keeping {compression}% of coefficients → PSNR: {psnr:.1f} dB")
     
-    st.info(f"💾 Keeping {compression}% of coefficients → PSNR: {psnr:.1f} dB")
+    compression_demo()
 
 # Footer
 st.markdown("---")
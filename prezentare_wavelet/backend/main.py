@@ -10,7 +10,7 @@ Provides APIs for:
 """
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import Optional, List
@@ -18,18 +18,35 @@ from pathlib import Path
 import numpy as np
 from PIL import Image
 import pywt
+import orjson
+import scipy.fft as spfft
 import io
 import base64
 import os
+import asyncio
+import ast
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
 # Path to data folder - use DATA_DIR env var (Docker) or fallback to relative path (local dev)
 DATA_DIR = Path(os.environ.get("DATA_DIR", Path(__file__).parent.parent / "data"))
 TEST_IMAGES_DIR = DATA_DIR / "standard_test_images"
+SPRITE_IMAGES_DIR = DATA_DIR / "sprite_images"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Decode the static sample/sprite sets once so requests never touch PIL
+    await asyncio.to_thread(preload_image_caches)
+    yield
+
 
 app = FastAPI(
     title="Wavelet DSP API",
     description="Backend for wavelet vs DCT interactive presentation",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS for frontend
@@ -46,6 +63,14 @@ app.add_middleware(
 # Models
 # ============================================================================
 
+class NumpyJSONResponse(Response):
+    """JSON response that serializes numpy arrays natively via orjson"""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
 class WaveletParams(BaseModel):
     wavelet: str = "db4"
     levels: int = 3
@@ -65,28 +90,234 @@ class DCTParams(BaseModel):
 # Utility Functions
 # ============================================================================
 
+# Shared worker pool for per-subband work (PNG encode and numpy release the GIL)
+_WORKER_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+@lru_cache(maxsize=64)
+def _encode_png(arr_bytes: bytes, shape: tuple, dtype_str: str) -> str:
+    """Encode raw uint8 pixels to a base64 PNG string (cached per pixel content)"""
+    arr = np.frombuffer(arr_bytes, np.dtype(dtype_str)).reshape(shape)
+    img = Image.fromarray(arr)
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG", compress_level=1, optimize=False)
+    return base64.b64encode(buffer.getvalue()).decode()
+
+
+@lru_cache(maxsize=64)
+def get_wavelet(name: str) -> pywt.Wavelet:
+    """Get a pywt.Wavelet by name, building its filter bank only once"""
+    return pywt.Wavelet(name)
+
+
+@lru_cache(maxsize=64)
+def get_wavelet_functions(name: str, level: int = 8) -> tuple:
+    """(phi, psi, x) from the wavefun cascade, evaluated once per wavelet and level"""
+    functions = get_wavelet(name).wavefun(level=level)
+    # Biorthogonal wavelets also return reconstruction functions; keep decomposition ones
+    phi, psi, x = functions[0], functions[1], functions[-1]
+    for arr in (phi, psi, x):
+        arr.setflags(write=False)
+    return phi, psi, x
+
+
+def _haar_wavedec2_fast(img: np.ndarray, levels: int) -> list:
+    """Haar DWT as stride-2 sums/differences (same layout as pywt.wavedec2)"""
+    a = np.asarray(img)
+    details = []
+    for _ in range(levels):
+        p, q, r, s = a[::2, ::2], a[::2, 1::2], a[1::2, ::2], a[1::2, 1::2]
+        details.append((
+            (p + q - r - s) * 0.5,  # LH
+            (p - q + r - s) * 0.5,  # HL
+            (p - q - r + s) * 0.5,  # HH
+        ))
+        a = (p + q + r + s) * 0.5
+    return [a] + details[::-1]
+
+
+def _haar_waverec2_fast(coeffs: list) -> np.ndarray:
+    """Inverse Haar DWT (transposed 2x2 filters), equivalent to pywt.waverec2"""
+    a = coeffs[0]
+    for lh, hl, hh in coeffs[1:]:
+        a = a[:lh.shape[0], :lh.shape[1]]
+        out = np.empty((2 * a.shape[0], 2 * a.shape[1]), dtype=np.result_type(a, lh))
+        out[::2, ::2] = (a + lh + hl + hh) * 0.5
+        out[::2, 1::2] = (a + lh - hl - hh) * 0.5
+        out[1::2, ::2] = (a - lh + hl - hh) * 0.5
+        out[1::2, 1::2] = (a - lh - hl + hh) * 0.5
+        a = out
+    return a
+
+
+def threshold_inplace(a: np.ndarray, threshold: float, mode: str = "soft") -> np.ndarray:
+    """Soft/hard threshold an array in place (same rule as pywt.threshold)"""
+    if mode == "soft":
+        mag = np.abs(a)
+        np.subtract(mag, threshold, out=mag)
+        np.maximum(mag, 0, out=mag)
+        np.copysign(mag, a, out=a)
+    elif mode == "hard":
+        a[np.abs(a) < threshold] = 0
+    else:
+        a[...] = pywt.threshold(a, threshold, mode=mode)
+    return a
+
+
+def useful_levels(shape: tuple, wavelet: str, levels: int) -> int:
+    """Clamp levels to pywt's max level, beyond which every band is boundary artefact"""
+    max_level = pywt.dwt_max_level(min(shape), get_wavelet(wavelet).dec_len)
+    return max(1, min(levels, max_level))
+
+
+def estimate_noise_sigma(hh: np.ndarray) -> float:
+    """Robust noise sigma, median(|HH|) / 0.6745, via in-place O(n) selection"""
+    mag = np.abs(hh).ravel()  # fresh buffer, so it can be partitioned in place
+    k = mag.size // 2
+    if mag.size % 2:
+        mag.partition(k)
+        median = mag[k]
+    else:
+        mag.partition((k - 1, k))
+        median = (mag[k - 1] + mag[k]) / 2
+    return float(median) / 0.6745
+
+
+def threshold_details(coeffs: list, threshold: float, mode: str = "soft") -> list:
+    """Threshold every detail subband of a wavedec2 list in place, keeping LL"""
+    # Bands are independent and the numpy passes release the GIL: run them concurrently
+    bands = [band for level in coeffs[1:] for band in level]
+    list(_WORKER_POOL.map(lambda band: threshold_inplace(band, threshold, mode), bands))
+    return coeffs
+
+
+# Standard JPEG luminance quantization matrix (quality 50)
+JPEG_Q50 = np.array([
+    [16, 11, 10, 16, 24, 40, 51, 61],
+    [12, 12, 14, 19, 26, 58, 60, 55],
+    [14, 13, 16, 24, 40, 57, 69, 56],
+    [14, 17, 22, 29, 51, 87, 80, 62],
+    [18, 22, 37, 56, 68, 109, 103, 77],
+    [24, 35, 55, 64, 81, 104, 113, 92],
+    [49, 64, 78, 87, 103, 121, 120, 101],
+    [72, 92, 95, 98, 112, 100, 103, 99]
+], dtype=np.float64)
+
+
+@lru_cache(maxsize=8)
+def dct_matrix(n: int, dtype: np.dtype) -> np.ndarray:
+    """Orthonormal DCT-II matrix C, so that dctn(B, norm='ortho') == C @ B @ C.T"""
+    C = spfft.dct(np.eye(n), norm='ortho', axis=0).astype(dtype)
+    C.setflags(write=False)
+    return C
+
+
+@lru_cache(maxsize=128)
+def quant_table(quality: int, dtype: np.dtype) -> np.ndarray:
+    """JPEG_Q50 scaled for a quality level (libjpeg formula), cached read-only per (quality, dtype)"""
+    if quality < 50:
+        scale = 5000 / quality
+    else:
+        scale = 200 - 2 * quality
+    Q = np.clip(np.floor((JPEG_Q50 * scale + 50) / 100), 1, 255).astype(dtype)
+    Q.setflags(write=False)
+    return Q
+
+
+def dct_compress(img: np.ndarray, quality: int, block_size: int = 8) -> np.ndarray:
+    """JPEG-style 8x8 DCT quantize/dequantize round trip, all blocks in one batched dctn"""
+    h, w = img.shape
+    
+    # Pad to block size
+    pad_h = (block_size - h % block_size) % block_size
+    pad_w = (block_size - w % block_size) % block_size
+    padded = np.pad(img, ((0, pad_h), (0, pad_w)), mode='edge')
+    
+    Q = quant_table(quality, img.dtype)
+    
+    # Process all blocks at once: (H, W) -> (H/8, W/8, 8, 8)
+    H, W = padded.shape
+    blocks = padded.reshape(H // block_size, block_size, W // block_size, block_size).swapaxes(1, 2) - 128
+    # 2D DCT as batched 8x8 matmuls C @ B @ C.T (BLAS beats FFT dispatch at this size)
+    C = dct_matrix(block_size, blocks.dtype)
+    dct_blocks = C @ blocks @ C.T
+    # Quantize + dequantize in place on the coefficient buffer
+    np.divide(dct_blocks, Q, out=dct_blocks)
+    np.round(dct_blocks, out=dct_blocks)
+    np.multiply(dct_blocks, Q, out=dct_blocks)
+    # Inverse DCT (C is orthonormal, so its inverse is C.T), level shift and clip in place
+    idct_blocks = C.T @ dct_blocks @ C
+    idct_blocks += 128
+    np.clip(idct_blocks, 0, 255, out=idct_blocks)
+    
+    return idct_blocks.swapaxes(1, 2).reshape(H, W)[:h, :w]
+
+
+def wavelet_compress(img: np.ndarray, wavelet: str, levels: int, threshold: float) -> np.ndarray:
+    """Wavelet compression stand-in: soft-threshold every detail band, reconstruct and clip"""
+    h, w = img.shape
+    coeffs = pywt.wavedec2(img, get_wavelet(wavelet), level=levels)
+    threshold_details(coeffs, threshold, 'soft')
+    result = pywt.waverec2(coeffs, get_wavelet(wavelet))[:h, :w]
+    return np.clip(result, 0, 255, out=result)
+
+
+def wavelet_decompose(img: np.ndarray, wavelet: str, levels: int) -> list:
+    """pywt.wavedec2, with a fast path for Haar on images divisible by 2**levels"""
+    step = 1 << levels
+    if wavelet == "haar" and img.shape[0] % step == 0 and img.shape[1] % step == 0:
+        return _haar_wavedec2_fast(img, levels)
+    return pywt.wavedec2(img, get_wavelet(wavelet), level=levels)
+
+
+def wavelet_reconstruct(coeffs: list, wavelet: str) -> np.ndarray:
+    """pywt.waverec2, with a fast path for Haar"""
+    if wavelet == "haar":
+        return _haar_waverec2_fast(coeffs)
+    return pywt.waverec2(coeffs, get_wavelet(wavelet))
+
+
 def image_to_base64(img_array: np.ndarray) -> str:
     """Convert numpy array to base64 PNG string"""
     if img_array.dtype != np.uint8:
         img_array = np.clip(img_array, 0, 255).astype(np.uint8)
-    img = Image.fromarray(img_array)
-    buffer = io.BytesIO()
-    img.save(buffer, format="PNG")
-    return base64.b64encode(buffer.getvalue()).decode()
+    return _encode_png(img_array.tobytes(), img_array.shape, img_array.dtype.str)
+
+
+def display_base64(arr: np.ndarray) -> str:
+    """Normalize an array for display and encode it as a base64 PNG"""
+    return image_to_base64(normalize_for_display(arr))
+
+
+async def encode_display_images(arrays: list) -> list:
+    """display_base64 for several arrays concurrently, off the event loop"""
+    return await asyncio.gather(*(asyncio.to_thread(display_base64, arr) for arr in arrays))
+
+
+def load_image_gray(path: Path) -> np.ndarray:
+    """Load an image file as grayscale float32 numpy array"""
+    img = Image.open(path).convert('L')
+    return np.array(img, dtype=np.float32)
 
 
 def load_image_from_upload(file: UploadFile) -> np.ndarray:
     """Load uploaded image as grayscale numpy array"""
-    contents = file.file.read()
-    img = Image.open(io.BytesIO(contents)).convert('L')
-    return np.array(img, dtype=np.float64)
+    # Decode straight from the spooled upload file (no intermediate bytes copy)
+    file.file.seek(0)
+    img = Image.open(file.file).convert('L')
+    return np.asarray(img, dtype=np.float32)
 
 
-def normalize_for_display(arr: np.ndarray) -> np.ndarray:
-    """Normalize array to 0-255 for display"""
-    if arr.max() == arr.min():
+def normalize_for_display(arr: np.ndarray, vmin=None, vmax=None) -> np.ndarray:
+    """Normalize array to 0-255 for display (pass vmin/vmax to skip the min/max scans)"""
+    lo = arr.min() if vmin is None else vmin
+    hi = arr.max() if vmax is None else vmax
+    if hi == lo:
         return np.zeros_like(arr, dtype=np.uint8)
-    normalized = 255 * (arr - arr.min()) / (arr.max() - arr.min())
+    # One temporary, scaled in place (same operation order as 255 * (arr - lo) / (hi - lo))
+    normalized = np.subtract(arr, lo, dtype=np.result_type(arr.dtype, np.float32))
+    normalized *= 255
+    normalized /= hi - lo
     return normalized.astype(np.uint8)
 
 
@@ -115,6 +346,47 @@ async def list_wavelets():
     }
 
 
+def _encode_subband(name: str, band: np.ndarray, display: np.ndarray) -> dict:
+    """Encode one (already normalized) subband as a PNG plus summary statistics"""
+    info = {
+        "image": image_to_base64(display),
+        "shape": list(band.shape)
+    }
+    if name == "LL":
+        info.update(min=float(band.min()), max=float(band.max()), mean=float(band.mean()))
+    else:
+        info["energy"] = subband_energy(band)
+    return info
+
+
+def _decompose(img_array: np.ndarray, wavelet: str, levels: int) -> dict:
+    """Decompose an image and encode its subbands (runs in a worker thread)"""
+    # Perform decomposition
+    coeffs = wavelet_decompose(img_array, wavelet, levels)
+    
+    # LL (approximation at coarsest level), then detail subbands at each level
+    names, bands = ["LL"], [coeffs[0]]
+    for i, (lh, hl, hh) in enumerate(coeffs[1:], 1):
+        level = levels - i + 1
+        names += [f"LH{level}", f"HL{level}", f"HH{level}"]
+        bands += [lh, hl, hh]
+    
+    # Normalize each subband once; the subband PNGs and the composite share the results
+    displays = list(_WORKER_POOL.map(normalize_for_display, bands))
+    composite_future = _WORKER_POOL.submit(create_wavelet_composite, group_subbands(displays), True)
+    subbands = dict(zip(names, _WORKER_POOL.map(_encode_subband, names, bands, displays)))
+    composite = composite_future.result()
+    
+    return {
+        "success": True,
+        "original_shape": list(img_array.shape),
+        "wavelet": wavelet,
+        "levels": levels,
+        "subbands": subbands,
+        "composite": image_to_base64(composite)
+    }
+
+
 @app.post("/api/decompose")
 async def decompose_image(
     file: UploadFile = File(...),
@@ -126,78 +398,72 @@ async def decompose_image(
     Returns subbands as base64 images.
     """
     try:
-        # Load image
-        img_array = load_image_from_upload(file)
-        
-        # Perform decomposition
-        coeffs = pywt.wavedec2(img_array, wavelet, level=levels)
-        
-        # Extract subbands
-        subbands = {}
-        
-        # LL (approximation at coarsest level)
-        ll = coeffs[0]
-        subbands["LL"] = {
-            "image": image_to_base64(normalize_for_display(ll)),
-            "shape": list(ll.shape),
-            "min": float(ll.min()),
-            "max": float(ll.max()),
-            "mean": float(ll.mean())
-        }
-        
-        # Detail subbands at each level
-        for i, (lh, hl, hh) in enumerate(coeffs[1:], 1):
-            level = levels - i + 1
-            subbands[f"LH{level}"] = {
-                "image": image_to_base64(normalize_for_display(lh)),
-                "shape": list(lh.shape),
-                "energy": float(np.sum(lh**2))
-            }
-            subbands[f"HL{level}"] = {
-                "image": image_to_base64(normalize_for_display(hl)),
-                "shape": list(hl.shape),
-                "energy": float(np.sum(hl**2))
-            }
-            subbands[f"HH{level}"] = {
-                "image": image_to_base64(normalize_for_display(hh)),
-                "shape": list(hh.shape),
-                "energy": float(np.sum(hh**2))
-            }
-        
-        # Create composite visualization
-        composite = create_wavelet_composite(coeffs)
-        
-        return {
-            "success": True,
-            "original_shape": list(img_array.shape),
-            "wavelet": wavelet,
-            "levels": levels,
-            "subbands": subbands,
-            "composite": image_to_base64(composite)
-        }
+        img_array = await asyncio.to_thread(load_image_from_upload, file)
+        return await asyncio.to_thread(_decompose, img_array, wavelet, levels)
         
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-def create_wavelet_composite(coeffs) -> np.ndarray:
-    """Create composite image showing all subbands"""
-    # Start from coarsest level
-    result = normalize_for_display(coeffs[0])
+def subband_energy(band: np.ndarray) -> float:
+    """Sum of squares in a single pass (no band**2 temporary)"""
+    return float(np.einsum('ij,ij->', band, band))
+
+
+def group_subbands(bands: list) -> list:
+    """Regroup a flat [LL, LH, HL, HH, ...] list into the wavedec2 coeffs layout"""
+    return [bands[0]] + [tuple(bands[i:i + 3]) for i in range(1, len(bands), 3)]
+
+
+def create_wavelet_composite(coeffs, normalized: bool = False) -> np.ndarray:
+    """Create composite image showing all subbands (normalized=True: bands are already uint8)"""
+    norm = (lambda band: band) if normalized else normalize_for_display
+    # Final size: each level places its details right of / below the coarser composite
+    h, w = coeffs[0].shape
+    for lh, hl, hh in coeffs[1:]:
+        h, w = h + hl.shape[0], w + lh.shape[1]
+    result = np.zeros((h, w), dtype=np.uint8)
     
+    # Start from coarsest level and blit each quad into place
+    h, w = coeffs[0].shape
+    result[:h, :w] = norm(coeffs[0])
     for lh, hl, hh in coeffs[1:]:
-        lh_norm = normalize_for_display(lh)
-        hl_norm = normalize_for_display(hl)
-        hh_norm = normalize_for_display(hh)
-        
-        # Combine into quad
-        top = np.hstack([result, lh_norm])
-        bottom = np.hstack([hl_norm, hh_norm])
-        result = np.vstack([top, bottom])
+        result[:lh.shape[0], w:w + lh.shape[1]] = norm(lh)
+        result[h:h + hl.shape[0], :hl.shape[1]] = norm(hl)
+        result[h:h + hh.shape[0], w:w + hh.shape[1]] = norm(hh)
+        h, w = h + hl.shape[0], w + lh.shape[1]
     
     return result
 
 
+def _reconstruct(img_array: np.ndarray, wavelet: str, levels: int, keep_levels: int) -> dict:
+    """Decompose, drop detail levels and reconstruct (runs in a worker thread)"""
+    # Decompose
+    coeffs = wavelet_decompose(img_array, wavelet, levels)
+    
+    # Zero out higher detail levels if requested
+    if keep_levels < levels:
+        for i in range(1, levels - keep_levels + 1):
+            coeffs[i] = tuple(np.zeros_like(c) for c in coeffs[i])
+    
+    # Reconstruct
+    reconstructed = wavelet_reconstruct(coeffs, wavelet)
+    reconstructed = reconstructed[:img_array.shape[0], :img_array.shape[1]]
+    
+    # Calculate metrics
+    mse = np.mean((img_array - reconstructed) ** 2, dtype=np.float64)
+    psnr = 10 * np.log10(255**2 / mse) if mse > 0 else float('inf')
+    
+    return {
+        "success": True,
+        "original": image_to_base64(normalize_for_display(img_array)),
+        "reconstructed": image_to_base64(normalize_for_display(reconstructed)),
+        "mse": float(mse),
+        "psnr": float(psnr),
+        "levels_used": keep_levels
+    }
+
+
 @app.post("/api/reconstruct")
 async def reconstruct_image(
     file: UploadFile = File(...),
@@ -210,37 +476,72 @@ async def reconstruct_image(
     Useful for demonstrating progressive reconstruction.
     """
     try:
-        img_array = load_image_from_upload(file)
-        
-        # Decompose
-        coeffs = pywt.wavedec2(img_array, wavelet, level=levels)
-        
-        # Zero out higher detail levels if requested
-        if keep_levels < levels:
-            for i in range(1, levels - keep_levels + 1):
-                coeffs[i] = tuple(np.zeros_like(c) for c in coeffs[i])
-        
-        # Reconstruct
-        reconstructed = pywt.waverec2(coeffs, wavelet)
-        reconstructed = reconstructed[:img_array.shape[0], :img_array.shape[1]]
-        
-        # Calculate metrics
-        mse = np.mean((img_array - reconstructed) ** 2)
-        psnr = 10 * np.log10(255**2 / mse) if mse > 0 else float('inf')
-        
-        return {
-            "success": True,
-            "original": image_to_base64(normalize_for_display(img_array)),
-            "reconstructed": image_to_base64(normalize_for_display(reconstructed)),
-            "mse": float(mse),
-            "psnr": float(psnr),
-            "levels_used": keep_levels
-        }
+        img_array = await asyncio.to_thread(load_image_from_upload, file)
+        return await asyncio.to_thread(_reconstruct, img_array, wavelet, levels, keep_levels)
         
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _denoise(
+    img_array: np.ndarray,
+    wavelet: str,
+    levels: int,
+    threshold: Optional[float],
+    mode: str,
+    add_noise: bool,
+    noise_sigma: float
+) -> dict:
+    """Optionally add noise, then wavelet-denoise (runs in a worker thread)"""
+    original = img_array.copy()
+    
+    # Add noise if requested
+    if add_noise:
+        # Local PCG64 generator: draws float32 directly and leaves global RNG state alone
+        rng = np.random.default_rng(42)
+        noisy = rng.standard_normal(img_array.shape, dtype=np.float32)
+        noisy *= noise_sigma
+        noisy += img_array
+        img_array = np.clip(noisy, 0, 255, out=noisy)
+    
+    # Decompose
+    coeffs = wavelet_decompose(img_array, wavelet, useful_levels(img_array.shape, wavelet, levels))
+    
+    # Estimate noise and compute threshold if not provided
+    hh = coeffs[-1][2]  # Finest HH
+    sigma = estimate_noise_sigma(hh)
+    if threshold is None:
+        threshold = sigma * np.sqrt(2 * np.log(img_array.size))
+    
+    # Threshold detail coefficients
+    thresholded = threshold_details(coeffs, threshold, mode)
+    
+    # Reconstruct
+    denoised = wavelet_reconstruct(thresholded, wavelet)
+    denoised = np.clip(denoised[:img_array.shape[0], :img_array.shape[1]], 0, 255)
+    
+    # Calculate metrics
+    if add_noise:
+        signal_power = np.mean(original**2, dtype=np.float64)
+        snr_before = 10 * np.log10(signal_power / np.mean((original - img_array)**2, dtype=np.float64))
+        snr_after = 10 * np.log10(signal_power / np.mean((original - denoised)**2, dtype=np.float64))
+    else:
+        snr_before = None
+        snr_after = None
+    
+    return {
+        "success": True,
+        "original": image_to_base64(normalize_for_display(original)),
+        "noisy": image_to_base64(normalize_for_display(img_array)) if add_noise else None,
+        "denoised": image_to_base64(normalize_for_display(denoised)),
+        "estimated_sigma": float(sigma),
+        "threshold_used": float(threshold),
+        "snr_before": float(snr_before) if snr_before else None,
+        "snr_after": float(snr_after) if snr_after else None,
+        "snr_improvement": float(snr_after - snr_before) if snr_before else None
+    }
+
+
 @app.post("/api/denoise")
 async def denoise_image(
     file: UploadFile = File(...),
@@ -256,61 +557,44 @@ async def denoise_image(
     Optionally adds noise first for demonstration.
     """
     try:
-        img_array = load_image_from_upload(file)
-        original = img_array.copy()
-        
-        # Add noise if requested
-        if add_noise:
-            np.random.seed(42)
-            noise = np.random.normal(0, noise_sigma, img_array.shape)
-            img_array = np.clip(img_array + noise, 0, 255)
-        
-        # Decompose
-        coeffs = pywt.wavedec2(img_array, wavelet, level=levels)
-        
-        # Estimate noise and compute threshold if not provided
-        hh = coeffs[-1][2]  # Finest HH
-        sigma = np.median(np.abs(hh)) / 0.6745
-        if threshold is None:
-            threshold = sigma * np.sqrt(2 * np.log(img_array.size))
-        
-        # Threshold detail coefficients
-        thresholded = [coeffs[0]]
-        for lh, hl, hh in coeffs[1:]:
-            thresholded.append((
-                pywt.threshold(lh, threshold, mode=mode),
-                pywt.threshold(hl, threshold, mode=mode),
-                pywt.threshold(hh, threshold, mode=mode)
-            ))
-        
-        # Reconstruct
-        denoised = pywt.waverec2(thresholded, wavelet)
-        denoised = np.clip(denoised[:img_array.shape[0], :img_array.shape[1]], 0, 255)
-        
-        # Calculate metrics
-        if add_noise:
-            snr_before = 10 * np.log10(np.mean(original**2) / np.mean((original - img_array)**2))
-            snr_after = 10 * np.log10(np.mean(original**2) / np.mean((original - denoised)**2))
-        else:
-            snr_before = None
-            snr_after = None
-        
-        return {
-            "success": True,
-            "original": image_to_base64(normalize_for_display(original)),
-            "noisy": image_to_base64(normalize_for_display(img_array)) if add_noise else None,
-            "denoised": image_to_base64(normalize_for_display(denoised)),
-            "estimated_sigma": float(sigma),
-            "threshold_used": float(threshold),
-            "snr_before": float(snr_before) if snr_before else None,
-            "snr_after": float(snr_after) if snr_after else None,
-            "snr_improvement": float(snr_after - snr_before) if snr_before else None
-        }
+        img_array = await asyncio.to_thread(load_image_from_upload, file)
+        return await asyncio.to_thread(_denoise, img_array, wavelet, levels, threshold, mode, add_noise, noise_sigma)
         
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _compare_dct_wavelet(img_array: np.ndarray, quality: int, wavelet: str, levels: int) -> dict:
+    """DCT vs wavelet compression of one image (runs in a worker thread)"""
+    # === DCT Compression (JPEG-style) ===
+    dct_result = dct_compress(img_array, quality)
+    
+    # === Wavelet Compression ===
+    # Threshold to achieve similar compression
+    # (simplified - real JPEG2000 uses sophisticated bit allocation)
+    threshold = (100 - quality) * 0.3
+    wavelet_result = wavelet_compress(img_array, wavelet, levels, threshold)
+    
+    # Calculate metrics
+    mse_dct = np.mean((img_array - dct_result) ** 2, dtype=np.float64)
+    mse_wav = np.mean((img_array - wavelet_result) ** 2, dtype=np.float64)
+    
+    psnr_dct = 10 * np.log10(255**2 / mse_dct) if mse_dct > 0 else float('inf')
+    psnr_wav = 10 * np.log10(255**2 / mse_wav) if mse_wav > 0 else float('inf')
+    
+    return {
+        "success": True,
+        "original": image_to_base64(normalize_for_display(img_array)),
+        "dct_result": image_to_base64(normalize_for_display(dct_result)),
+        "wavelet_result": image_to_base64(normalize_for_display(wavelet_result)),
+        "quality": quality,
+        "metrics": {
+            "dct": {"mse": float(mse_dct), "psnr": float(psnr_dct)},
+            "wavelet": {"mse": float(mse_wav), "psnr": float(psnr_wav)}
+        }
+    }
+
+
 @app.post("/api/compare-dct")
 async def compare_dct_wavelet(
     file: UploadFile = File(...),
@@ -321,98 +605,15 @@ async def compare_dct_wavelet(
     """
     Compare DCT (JPEG-style) vs Wavelet compression at similar quality.
     """
-    from scipy.fftpack import dct, idct
-    
     try:
-        img_array = load_image_from_upload(file)
-        
-        # === DCT Compression (JPEG-style) ===
-        block_size = 8
-        h, w = img_array.shape
-        
-        # Pad to block size
-        pad_h = (block_size - h % block_size) % block_size
-        pad_w = (block_size - w % block_size) % block_size
-        padded = np.pad(img_array, ((0, pad_h), (0, pad_w)), mode='edge')
-        
-        # Standard quantization matrix
-        Q50 = np.array([
-            [16, 11, 10, 16, 24, 40, 51, 61],
-            [12, 12, 14, 19, 26, 58, 60, 55],
-            [14, 13, 16, 24, 40, 57, 69, 56],
-            [14, 17, 22, 29, 51, 87, 80, 62],
-            [18, 22, 37, 56, 68, 109, 103, 77],
-            [24, 35, 55, 64, 81, 104, 113, 92],
-            [49, 64, 78, 87, 103, 121, 120, 101],
-            [72, 92, 95, 98, 112, 100, 103, 99]
-        ], dtype=np.float64)
-        
-        # Scale by quality
-        if quality < 50:
-            scale = 5000 / quality
-        else:
-            scale = 200 - 2 * quality
-        Q = np.clip(np.floor((Q50 * scale + 50) / 100), 1, 255)
-        
-        # Process blocks
-        dct_result = np.zeros_like(padded)
-        for i in range(0, padded.shape[0], block_size):
-            for j in range(0, padded.shape[1], block_size):
-                block = padded[i:i+block_size, j:j+block_size] - 128
-                # 2D DCT
-                dct_block = dct(dct(block.T, norm='ortho').T, norm='ortho')
-                # Quantize
-                quantized = np.round(dct_block / Q)
-                # Dequantize
-                dequantized = quantized * Q
-                # Inverse DCT
-                idct_block = idct(idct(dequantized.T, norm='ortho').T, norm='ortho') + 128
-                dct_result[i:i+block_size, j:j+block_size] = idct_block
-        
-        dct_result = np.clip(dct_result[:h, :w], 0, 255)
-        
-        # === Wavelet Compression ===
-        coeffs = pywt.wavedec2(img_array, wavelet, level=levels)
-        
-        # Threshold to achieve similar compression
-        # (simplified - real JPEG2000 uses sophisticated bit allocation)
-        threshold = (100 - quality) * 0.3
-        
-        thresholded = [coeffs[0]]
-        for lh, hl, hh in coeffs[1:]:
-            thresholded.append((
-                pywt.threshold(lh, threshold, mode='soft'),
-                pywt.threshold(hl, threshold, mode='soft'),
-                pywt.threshold(hh, threshold, mode='soft')
-            ))
-        
-        wavelet_result = pywt.waverec2(thresholded, wavelet)
-        wavelet_result = np.clip(wavelet_result[:h, :w], 0, 255)
-        
-        # Calculate metrics
-        mse_dct = np.mean((img_array - dct_result) ** 2)
-        mse_wav = np.mean((img_array - wavelet_result) ** 2)
-        
-        psnr_dct = 10 * np.log10(255**2 / mse_dct) if mse_dct > 0 else float('inf')
-        psnr_wav = 10 * np.log10(255**2 / mse_wav) if mse_wav > 0 else float('inf')
-        
-        return {
-            "success": True,
-            "original": image_to_base64(normalize_for_display(img_array)),
-            "dct_result": image_to_base64(normalize_for_display(dct_result)),
-            "wavelet_result": image_to_base64(normalize_for_display(wavelet_result)),
-            "quality": quality,
-            "metrics": {
-                "dct": {"mse": float(mse_dct), "psnr": float(psnr_dct)},
-                "wavelet": {"mse": float(mse_wav), "psnr": float(psnr_wav)}
-            }
-        }
+        img_array = await asyncio.to_thread(load_image_from_upload, file)
+        return await asyncio.to_thread(_compare_dct_wavelet, img_array, quality, wavelet, levels)
         
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@app.get("/api/signal-demo")
+@app.get("/api/signal-demo", response_class=NumpyJSONResponse)
 async def signal_demo(
     frequency: float = 5.0,
     samples: int = 256,
@@ -431,29 +632,99 @@ async def signal_demo(
     noisy = signal + np.random.normal(0, noise_level, samples)
     
     # Wavelet decomposition
-    coeffs = pywt.wavedec(noisy, 'db4', level=4)
+    coeffs = pywt.wavedec(noisy, get_wavelet('db4'), level=4)
     
     # Denoise
     threshold = noise_level * np.sqrt(2 * np.log(samples))
     denoised_coeffs = [coeffs[0]] + [pywt.threshold(c, threshold, mode='soft') for c in coeffs[1:]]
-    denoised = pywt.waverec(denoised_coeffs, 'db4')[:samples]
+    denoised = pywt.waverec(denoised_coeffs, get_wavelet('db4'))[:samples]
     
-    return {
-        "t": t.tolist(),
-        "signal": signal.tolist(),
-        "noisy": noisy.tolist(),
-        "denoised": denoised.tolist(),
+    # Detail bands are ragged: send one flat array plus offsets (level i is flat[off[i]:off[i+1]])
+    details_offsets = np.cumsum([0] + [len(c) for c in coeffs[1:]])
+    
+    # Arrays are serialized directly by orjson (no tolist boxing)
+    return NumpyJSONResponse({
+        "t": t,
+        "signal": signal,
+        "noisy": noisy,
+        "denoised": denoised,
         "coefficients": {
-            "approximation": coeffs[0].tolist(),
-            "details": [c.tolist() for c in coeffs[1:]]
+            "approximation": coeffs[0],
+            "details_flat": np.concatenate(coeffs[1:]),
+            "details_offsets": details_offsets
         }
-    }
+    })
 
 
 # ============================================================================
 # Sample Images API
 # ============================================================================
 
+# image_id -> (grayscale float32 pixels, base64 PNG of the display image)
+SAMPLE_CACHE: dict[str, tuple[np.ndarray, str]] = {}
+# image_id -> (RGB uint8 pixels, base64 PNG) (colour kernel demos)
+SAMPLE_RGB_CACHE: dict[str, tuple[np.ndarray, str]] = {}
+# sprite_id -> RGB uint8 pixels
+SPRITE_CACHE: dict[str, np.ndarray] = {}
+
+
+def get_cached_sample(image_id: str) -> tuple[np.ndarray, str]:
+    """Return cached (pixels, base64) for a sample image, loading it on first miss"""
+    entry = SAMPLE_CACHE.get(image_id)
+    if entry is None:
+        img_path = TEST_IMAGES_DIR / f"{image_id}.png"
+        if not img_path.exists():
+            raise HTTPException(status_code=404, detail=f"Image {image_id} not found")
+        img_array = load_image_gray(img_path)
+        img_array.setflags(write=False)
+        entry = SAMPLE_CACHE[image_id] = (img_array, image_to_base64(normalize_for_display(img_array)))
+    return entry
+
+
+def get_cached_sample_rgb(image_id: str) -> tuple[np.ndarray, str]:
+    """Return cached RGB (pixels, base64) for a sample image, loading it on first miss"""
+    entry = SAMPLE_RGB_CACHE.get(image_id)
+    if entry is None:
+        img_path = TEST_IMAGES_DIR / f"{image_id}.png"
+        if not img_path.exists():
+            raise HTTPException(status_code=404, detail=f"Image {image_id} not found")
+        pixels = np.asarray(Image.open(img_path).convert('RGB'), dtype=np.uint8)
+        pixels.setflags(write=False)
+        entry = SAMPLE_RGB_CACHE[image_id] = (pixels, image_to_base64(pixels))
+    return entry
+
+
+def original_b64(image_id: str, mode: str = "L") -> str:
+    """Base64 PNG of an untouched sample image ("L": display-normalized, "RGB": as stored)"""
+    if mode == "RGB":
+        return get_cached_sample_rgb(image_id)[1]
+    return get_cached_sample(image_id)[1]
+
+
+def get_cached_sprite(image_id: str) -> np.ndarray:
+    """Return cached RGB uint8 pixels for a sprite, loading it on first miss"""
+    pixels = SPRITE_CACHE.get(image_id)
+    if pixels is None:
+        img_path = SPRITE_IMAGES_DIR / f"{image_id}.png"
+        if not img_path.exists():
+            raise HTTPException(status_code=404, detail=f"Sprite {image_id} not found")
+        pixels = np.asarray(Image.open(img_path).convert('RGB'), dtype=np.uint8)
+        pixels.setflags(write=False)
+        SPRITE_CACHE[image_id] = pixels
+    return pixels
+
+
+def preload_image_caches():
+    """Decode every sample and sprite image into the in-memory caches"""
+    if TEST_IMAGES_DIR.exists():
+        for f in sorted(TEST_IMAGES_DIR.glob("*.png")):
+            get_cached_sample(f.stem)
+            get_cached_sample_rgb(f.stem)
+    if SPRITE_IMAGES_DIR.exists():
+        for f in sorted(SPRITE_IMAGES_DIR.glob("*.png")):
+            get_cached_sprite(f.stem)
+
+
 @app.get("/api/sample-images")
 async def list_sample_images():
     """List available sample images from standard_test_images"""
@@ -506,16 +777,11 @@ async def list_sample_images():
 @app.get("/api/sample-images/{image_id}")
 async def get_sample_image(image_id: str):
     """Get a sample image as base64"""
-    img_path = TEST_IMAGES_DIR / f"{image_id}.png"
-    if not img_path.exists():
-        raise HTTPException(status_code=404, detail=f"Image {image_id} not found")
-    
-    img = Image.open(img_path).convert('L')
-    img_array = np.array(img, dtype=np.float64)
+    img_array, img_b64 = await asyncio.to_thread(get_cached_sample, image_id)
     
     return {
         "id": image_id,
-        "image": image_to_base64(normalize_for_display(img_array)),
+        "image": img_b64,
         "shape": list(img_array.shape)
     }
 
@@ -535,14 +801,12 @@ async def get_sample_image_grayscale(image_id: str, size: int = 64):
     Get grayscale pixel data resized to specified size.
     Used for wavelet decomposition demos.
     """
-    img_path = TEST_IMAGES_DIR / f"{image_id}.png"
-    if not img_path.exists():
-        raise HTTPException(status_code=404, detail=f"Image {image_id} not found")
+    img_array, _ = get_cached_sample(image_id)
     
     # Clamp size
     size = max(8, min(256, size))
     
-    img = Image.open(img_path).convert('L')
+    img = Image.fromarray(img_array.astype(np.uint8))
     img = img.resize((size, size), Image.Resampling.LANCZOS)
     pixels = np.array(img, dtype=np.float64).tolist()
     
@@ -557,8 +821,6 @@ async def get_sample_image_grayscale(image_id: str, size: int = 64):
 # Sprite Images API (Educational - small pixel art for kernel demos)
 # ============================================================================
 
-SPRITE_IMAGES_DIR = DATA_DIR / "sprite_images"
-
 @app.get("/api/sprite-images")
 async def list_sprite_images():
     """List available sprite images for educational kernel demos"""
@@ -602,21 +864,17 @@ async def get_sprite_image(image_id: str, scale_to: int = 512):
     Get a sprite image scaled to display size using nearest neighbor.
     Preserves pixel art crisp edges.
     """
-    img_path = SPRITE_IMAGES_DIR / f"{image_id}.png"
-    if not img_path.exists():
-        raise HTTPException(status_code=404, detail=f"Sprite {image_id} not found")
-    
-    img = Image.open(img_path).convert('RGB')
-    original_size = img.size[0]  # Assume square
+    pixels = get_cached_sprite(image_id)
+    original_size = pixels.shape[1]  # Assume square
     
     # Scale with nearest neighbor to preserve pixel art
     if scale_to and scale_to != original_size:
-        img = img.resize((scale_to, scale_to), Image.Resampling.NEAREST)
+        pixels = np.asarray(
+            Image.fromarray(pixels).resize((scale_to, scale_to), Image.Resampling.NEAREST)
+        )
     
-    # Convert to base64
-    buffered = io.BytesIO()
-    img.save(buffered, format="PNG")
-    img_base64 = base64.b64encode(buffered.getvalue()).decode()
+    # Convert to base64 (cached per pixel content)
+    img_base64 = image_to_base64(pixels)
     
     return {
         "id": image_id,
@@ -633,17 +891,14 @@ async def get_sprite_pixels(image_id: str):
     Get raw pixel data for a sprite (unscaled).
     Returns the actual pixel values for educational visualization.
     """
-    img_path = SPRITE_IMAGES_DIR / f"{image_id}.png"
-    if not img_path.exists():
-        raise HTTPException(status_code=404, detail=f"Sprite {image_id} not found")
-    
-    img = Image.open(img_path).convert('RGB')
-    pixels = np.array(img)
+    pixels = get_cached_sprite(image_id)
     
     return {
         "id": image_id,
-        "size": img.size[0],
-        "pixels": pixels.tolist()  # 3D array: [row][col][rgb]
+        "size": pixels.shape[1],
+        "shape": list(pixels.shape),  # [rows, cols, rgb]
+        "dtype": "uint8",
+        "pixels_b64": base64.b64encode(np.ascontiguousarray(pixels).tobytes()).decode()
     }
 
 
@@ -675,7 +930,31 @@ async def get_sprite_grayscale(image_id: str, size: int = 8):
 # Fourier Transform API
 # ============================================================================
 
-@app.get("/api/fourier/function")
+# Names a signal expression may reference (each endpoint binds its own subset)
+_EXPR_NAMES = {"sin", "cos", "exp", "pi", "abs", "sqrt", "t"}
+_EXPR_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Constant, ast.Load,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.FloorDiv, ast.UAdd, ast.USub
+)
+
+
+@lru_cache(maxsize=256)
+def _compile_expr(expression: str):
+    """Parse, validate and compile a signal expression like 'sin(2*pi*5*t)'"""
+    tree = ast.parse(expression, mode='eval')
+    for node in ast.walk(tree):
+        if not isinstance(node, _EXPR_NODES):
+            raise ValueError(f"Unsupported syntax: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id not in _EXPR_NAMES:
+            raise ValueError(f"Unknown name: {node.id}")
+        if isinstance(node, ast.Call) and (node.keywords or not isinstance(node.func, ast.Name)):
+            raise ValueError("Only plain function calls are allowed")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float, complex)):
+            raise ValueError("Only numeric constants are allowed")
+    return compile(tree, '<expression>', 'eval')
+
+
+@app.get("/api/fourier/function", response_class=NumpyJSONResponse)
 async def fourier_function(
     expression: str = "sin(2*pi*5*t) + sin(2*pi*12*t)",
     samples: int = 512,
@@ -696,10 +975,10 @@ async def fourier_function(
             "pi": np.pi, "abs": np.abs, "sqrt": np.sqrt,
             "t": t
         }
-        signal = eval(expression, {"__builtins__": {}}, allowed_names)
+        signal = eval(_compile_expr(expression), {"__builtins__": {}}, allowed_names)
         
         # Compute FFT
-        fft = np.fft.fft(signal)
+        fft = spfft.fft(signal, workers=-1)
         freqs = np.fft.fftfreq(samples, duration / samples)
         
         # Only positive frequencies
@@ -708,72 +987,72 @@ async def fourier_function(
         magnitude = np.abs(fft[pos_mask]) * 2 / samples
         phase = np.angle(fft[pos_mask])
         
-        return {
+        return NumpyJSONResponse({
             "success": True,
             "expression": expression,
             "time": {
-                "t": t.tolist(),
-                "signal": signal.tolist()
+                "t": t,
+                "signal": signal
             },
             "frequency": {
-                "f": freqs_pos.tolist(),
-                "magnitude": magnitude.tolist(),
-                "phase": phase.tolist()
+                "f": freqs_pos,
+                "magnitude": magnitude,
+                "phase": phase
             }
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error evaluating expression: {str(e)}")
 
 
 @app.get("/api/fourier/image")
-async def fourier_image_sample(image_id: str = "lena_512"):
-    """Compute 2D Fourier transform of a sample image"""
-    img_path = TEST_IMAGES_DIR / f"{image_id}.png"
-    if not img_path.exists():
-        # Try without _512 suffix
-        img_path = TEST_IMAGES_DIR / f"{image_id}.png"
-        if not img_path.exists():
-            raise HTTPException(status_code=404, detail=f"Image {image_id} not found")
-    
-    img = Image.open(img_path).convert('L')
-    img_array = np.array(img, dtype=np.float64)
-    
-    # Compute 2D FFT
-    fft2 = np.fft.fft2(img_array)
+async def fourier_image_sample(
+    image_id: str = "lena_512",
+    include_phase: bool = False,
+    include_original: bool = True
+):
+    """
+    Compute 2D Fourier transform of a sample image.
+    Phase is opt-in; clients that already show the image can skip the original.
+    """
+    img_array, img_b64 = await asyncio.to_thread(get_cached_sample, image_id)
+    return await asyncio.to_thread(
+        _fourier_image, img_array, img_b64, include_phase, include_original
+    )
+
+
+def _fourier_image(
+    img_array: np.ndarray, img_b64: str, include_phase: bool, include_original: bool
+) -> dict:
+    """FFT spectrum images for fourier_image_sample (runs in a worker thread)"""
+    # Compute 2D FFT (scipy.fft keeps float32 input in complex64)
+    fft2 = spfft.fft2(img_array, workers=-1)
     fft2_shifted = np.fft.fftshift(fft2)
     
-    # Magnitude spectrum (log scale for visibility)
-    magnitude = np.log1p(np.abs(fft2_shifted))
-    phase = np.angle(fft2_shifted)
+    # Magnitude spectrum (log scale for visibility), computed in place on the float32 |F|
+    magnitude = np.abs(fft2_shifted)
+    np.log1p(magnitude, out=magnitude)
     
-    return {
+    result = {
         "success": True,
-        "original": image_to_base64(normalize_for_display(img_array)),
         "magnitude": image_to_base64(normalize_for_display(magnitude)),
-        "phase": image_to_base64(normalize_for_display(phase)),
         "shape": list(img_array.shape)
     }
+    if include_original:
+        result["original"] = img_b64
+    if include_phase:
+        result["phase"] = image_to_base64(normalize_for_display(np.angle(fft2_shifted)))
+    return result
 
 
 # ============================================================================
 # Filter Visualization API  
 # ============================================================================
 
-@app.get("/api/filters/lowpass")
-async def lowpass_filter_demo(
-    cutoff_hz: float = 30.0,
-    filter_type: str = "ideal",
-    order: int = 4,
-    samples: int = 256,
-    max_freq_hz: float = 100.0
-):
-    """
-    Demonstrate low-pass filter in frequency domain.
-    cutoff_hz: Cutoff frequency in Hz
-    order: Filter order for Butterworth (1, 2, 4, 8)
-    max_freq_hz: Maximum frequency to display (Hz)
-    Types: ideal, butterworth, gaussian
-    """
+@lru_cache(maxsize=256)
+def _lowpass_response(
+    cutoff_hz: float, filter_type: str, order: int, samples: int, max_freq_hz: float
+) -> dict:
+    """Low-pass demo payload (cached: the parameter space is tiny)"""
     # Work in Hz directly
     freqs_hz = np.linspace(0, max_freq_hz, samples)
     
@@ -788,9 +1067,8 @@ async def lowpass_filter_demo(
     else:
         response = np.where(freqs_hz <= cutoff_hz, 1.0, 0.0)
     
-    # Impulse response (inverse FFT of frequency response)
-    full_response = np.concatenate([response, response[::-1][1:-1]])
-    impulse = np.real(np.fft.ifft(full_response))
+    # Impulse response (real, even spectrum -> irfft of the half spectrum)
+    impulse = spfft.irfft(response, n=2 * (len(response) - 1), workers=-1)
     impulse = np.fft.fftshift(impulse)
     t_impulse = np.linspace(-1, 1, len(impulse))
     
@@ -808,8 +1086,8 @@ async def lowpass_filter_demo(
     }
 
 
-@app.get("/api/filters/highpass")
-async def highpass_filter_demo(
+@app.get("/api/filters/lowpass")
+async def lowpass_filter_demo(
     cutoff_hz: float = 30.0,
     filter_type: str = "ideal",
     order: int = 4,
@@ -817,10 +1095,20 @@ async def highpass_filter_demo(
     max_freq_hz: float = 100.0
 ):
     """
-    Demonstrate high-pass filter in frequency domain.
+    Demonstrate low-pass filter in frequency domain.
     cutoff_hz: Cutoff frequency in Hz
     order: Filter order for Butterworth (1, 2, 4, 8)
+    max_freq_hz: Maximum frequency to display (Hz)
+    Types: ideal, butterworth, gaussian
     """
+    return _lowpass_response(cutoff_hz, filter_type, order, samples, max_freq_hz)
+
+
+@lru_cache(maxsize=256)
+def _highpass_response(
+    cutoff_hz: float, filter_type: str, order: int, samples: int, max_freq_hz: float
+) -> dict:
+    """High-pass demo payload (cached: the parameter space is tiny)"""
     # Work in Hz directly
     freqs_hz = np.linspace(0, max_freq_hz, samples)
     
@@ -835,9 +1123,8 @@ async def highpass_filter_demo(
     else:
         response = np.where(freqs_hz >= cutoff_hz, 1.0, 0.0)
     
-    # Impulse response
-    full_response = np.concatenate([response, response[::-1][1:-1]])
-    impulse = np.real(np.fft.ifft(full_response))
+    # Impulse response (real, even spectrum -> irfft of the half spectrum)
+    impulse = spfft.irfft(response, n=2 * (len(response) - 1), workers=-1)
     impulse = np.fft.fftshift(impulse)
     t_impulse = np.linspace(-1, 1, len(impulse))
     
@@ -855,16 +1142,28 @@ async def highpass_filter_demo(
     }
 
 
-@app.get("/api/filters/bandpass")
-async def bandpass_filter_demo(
-    low_cutoff_hz: float = 20.0,
-    high_cutoff_hz: float = 60.0,
+@app.get("/api/filters/highpass")
+async def highpass_filter_demo(
+    cutoff_hz: float = 30.0,
     filter_type: str = "ideal",
     order: int = 4,
     samples: int = 256,
     max_freq_hz: float = 100.0
 ):
-    """Demonstrate band-pass filter in Hz"""
+    """
+    Demonstrate high-pass filter in frequency domain.
+    cutoff_hz: Cutoff frequency in Hz
+    order: Filter order for Butterworth (1, 2, 4, 8)
+    """
+    return _highpass_response(cutoff_hz, filter_type, order, samples, max_freq_hz)
+
+
+@lru_cache(maxsize=256)
+def _bandpass_response(
+    low_cutoff_hz: float, high_cutoff_hz: float, filter_type: str, order: int, samples: int,
+    max_freq_hz: float
+) -> dict:
+    """Band-pass demo payload (cached: the parameter space is tiny)"""
     freqs_hz = np.linspace(0, max_freq_hz, samples)
     
     if filter_type == "ideal":
@@ -894,6 +1193,27 @@ async def bandpass_filter_demo(
     }
 
 
+@app.get("/api/filters/bandpass")
+async def bandpass_filter_demo(
+    low_cutoff_hz: float = 20.0,
+    high_cutoff_hz: float = 60.0,
+    filter_type: str = "ideal",
+    order: int = 4,
+    samples: int = 256,
+    max_freq_hz: float = 100.0
+):
+    """Demonstrate band-pass filter in Hz"""
+    return _bandpass_response(
+        low_cutoff_hz, high_cutoff_hz, filter_type, order, samples, max_freq_hz
+    )
+
+
+# Warm the filter caches with the frontend's default parameters (FiltersView DEFAULTS)
+_lowpass_response(30.0, "butterworth", 4, 256, 100.0)
+_highpass_response(30.0, "butterworth", 4, 256, 100.0)
+_bandpass_response(20.0, 60.0, "butterworth", 4, 256, 100.0)
+
+
 @app.get("/api/filters/apply-signal")
 async def apply_filter_to_signal(
     expression: str = "sin(2*pi*5*t) + sin(2*pi*20*t) + sin(2*pi*50*t)",
@@ -914,10 +1234,10 @@ async def apply_filter_to_signal(
         
         t = np.linspace(0, 1, samples)
         allowed_names = {"sin": np.sin, "cos": np.cos, "exp": np.exp, "pi": np.pi, "t": t}
-        signal = eval(expression, {"__builtins__": {}}, allowed_names)
+        signal = eval(_compile_expr(expression), {"__builtins__": {}}, allowed_names)
         
         # FFT
-        fft = np.fft.fft(signal)
+        fft = spfft.fft(signal, workers=-1)
         freqs_normalized = np.fft.fftfreq(samples)  # Normalized: 1.0 = sample_rate
         freqs_hz = freqs_normalized * sample_rate    # Convert to Hz
         
@@ -933,7 +1253,7 @@ async def apply_filter_to_signal(
         
         # Apply filter
         filtered_fft = fft * filt
-        filtered_signal = np.real(np.fft.ifft(filtered_fft))
+        filtered_signal = np.real(spfft.ifft(filtered_fft, workers=-1))
         
         # Magnitude spectra (positive frequencies only)
         mag_original = np.abs(fft[:samples//2]) * 2 / samples
@@ -965,10 +1285,10 @@ async def apply_filter_to_signal(
 async def wavelet_basis(wavelet: str = "db4", samples: int = 128):
     """Get wavelet and scaling function for visualization"""
     try:
-        wav = pywt.Wavelet(wavelet)
+        wav = get_wavelet(wavelet)
         
-        # Get wavelet and scaling functions
-        phi, psi, x = wav.wavefun(level=8)
+        # Get wavelet and scaling functions (cached cascade)
+        phi, psi, x = get_wavelet_functions(wavelet, 8)
         
         # Resample to requested number of samples
         indices = np.linspace(0, len(x) - 1, samples).astype(int)
@@ -987,10 +1307,10 @@ async def wavelet_basis(wavelet: str = "db4", samples: int = 128):
                 "biorthogonal": wav.biorthogonal
             },
             "filters": {
-                "dec_lo": wav.dec_lo.tolist(),  # Decomposition low-pass
-                "dec_hi": wav.dec_hi.tolist(),  # Decomposition high-pass
-                "rec_lo": wav.rec_lo.tolist(),  # Reconstruction low-pass
-                "rec_hi": wav.rec_hi.tolist()   # Reconstruction high-pass
+                "dec_lo": list(wav.dec_lo),  # Decomposition low-pass
+                "dec_hi": list(wav.dec_hi),  # Decomposition high-pass
+                "rec_lo": list(wav.rec_lo),  # Reconstruction low-pass
+                "rec_hi": list(wav.rec_hi)   # Reconstruction high-pass
             }
         }
     except Exception as e:
@@ -1038,45 +1358,38 @@ async def decompose_sample_image(
     levels: int = 3
 ):
     """Decompose a sample image without upload"""
-    img_path = TEST_IMAGES_DIR / f"{image_id}.png"
-    if not img_path.exists():
-        raise HTTPException(status_code=404, detail=f"Image {image_id} not found")
-    
-    img = Image.open(img_path).convert('L')
-    img_array = np.array(img, dtype=np.float64)
+    img_array, _ = get_cached_sample(image_id)
     
-    # Perform decomposition
-    coeffs = pywt.wavedec2(img_array, wavelet, level=levels)
+    # Perform decomposition (pywt releases the GIL; keep the event loop free)
+    coeffs = await asyncio.to_thread(pywt.wavedec2, img_array, get_wavelet(wavelet), level=levels)
     
     # Extract subbands
-    subbands = {}
-    ll = coeffs[0]
-    subbands["LL"] = {
-        "image": image_to_base64(normalize_for_display(ll)),
-        "shape": list(ll.shape),
-        "energy": float(np.sum(ll**2))
-    }
-    
+    names, bands = ["LL"], [coeffs[0]]
     for i, (lh, hl, hh) in enumerate(coeffs[1:], 1):
         level = levels - i + 1
-        for name, arr in [("LH", lh), ("HL", hl), ("HH", hh)]:
-            subbands[f"{name}{level}"] = {
-                "image": image_to_base64(normalize_for_display(arr)),
-                "shape": list(arr.shape),
-                "energy": float(np.sum(arr**2))
-            }
-    
-    composite = create_wavelet_composite(coeffs)
+        names += [f"LH{level}", f"HL{level}", f"HH{level}"]
+        bands += [lh, hl, hh]
+    
+    # Normalize each subband once, then encode the PNGs and the composite from the same uint8 bands
+    displays = await asyncio.gather(*(asyncio.to_thread(normalize_for_display, b) for b in bands))
+    images, composite_b64 = await asyncio.gather(
+        asyncio.gather(*(asyncio.to_thread(image_to_base64, d) for d in displays)),
+        asyncio.to_thread(lambda: image_to_base64(create_wavelet_composite(group_subbands(displays), True)))
+    )
+    subbands = {
+        name: {"image": image, "shape": list(arr.shape), "energy": subband_energy(arr)}
+        for name, arr, image in zip(names, bands, images)
+    }
     
     return {
         "success": True,
         "image_id": image_id,
-        "original": image_to_base64(normalize_for_display(img_array)),
+        "original": original_b64(image_id),
         "original_shape": list(img_array.shape),
         "wavelet": wavelet,
         "levels": levels,
         "subbands": subbands,
-        "composite": image_to_base64(composite)
+        "composite": composite_b64
     }
 
 
@@ -1088,78 +1401,29 @@ async def compare_sample_image(
     levels: int = 4
 ):
     """Compare DCT vs Wavelet on a sample image"""
-    from scipy.fftpack import dct, idct
-    
-    img_path = TEST_IMAGES_DIR / f"{image_id}.png"
-    if not img_path.exists():
-        raise HTTPException(status_code=404, detail=f"Image {image_id} not found")
-    
-    img = Image.open(img_path).convert('L')
-    img_array = np.array(img, dtype=np.float64)
-    
-    # DCT compression (same as before)
-    block_size = 8
-    h, w = img_array.shape
-    pad_h = (block_size - h % block_size) % block_size
-    pad_w = (block_size - w % block_size) % block_size
-    padded = np.pad(img_array, ((0, pad_h), (0, pad_w)), mode='edge')
-    
-    Q50 = np.array([
-        [16, 11, 10, 16, 24, 40, 51, 61],
-        [12, 12, 14, 19, 26, 58, 60, 55],
-        [14, 13, 16, 24, 40, 57, 69, 56],
-        [14, 17, 22, 29, 51, 87, 80, 62],
-        [18, 22, 37, 56, 68, 109, 103, 77],
-        [24, 35, 55, 64, 81, 104, 113, 92],
-        [49, 64, 78, 87, 103, 121, 120, 101],
-        [72, 92, 95, 98, 112, 100, 103, 99]
-    ], dtype=np.float64)
-    
-    if quality < 50:
-        scale = 5000 / quality
-    else:
-        scale = 200 - 2 * quality
-    Q = np.clip(np.floor((Q50 * scale + 50) / 100), 1, 255)
-    
-    dct_result = np.zeros_like(padded)
-    for i in range(0, padded.shape[0], block_size):
-        for j in range(0, padded.shape[1], block_size):
-            block = padded[i:i+block_size, j:j+block_size] - 128
-            dct_block = dct(dct(block.T, norm='ortho').T, norm='ortho')
-            quantized = np.round(dct_block / Q)
-            dequantized = quantized * Q
-            idct_block = idct(idct(dequantized.T, norm='ortho').T, norm='ortho') + 128
-            dct_result[i:i+block_size, j:j+block_size] = idct_block
-    
-    dct_result = np.clip(dct_result[:h, :w], 0, 255)
-    
-    # Wavelet compression
-    coeffs = pywt.wavedec2(img_array, wavelet, level=levels)
+    img_array, _ = get_cached_sample(image_id)
     threshold = (100 - quality) * 0.3
     
-    thresholded = [coeffs[0]]
-    for lh, hl, hh in coeffs[1:]:
-        thresholded.append((
-            pywt.threshold(lh, threshold, mode='soft'),
-            pywt.threshold(hl, threshold, mode='soft'),
-            pywt.threshold(hh, threshold, mode='soft')
-        ))
-    
-    wavelet_result = pywt.waverec2(thresholded, wavelet)
-    wavelet_result = np.clip(wavelet_result[:h, :w], 0, 255)
+    # DCT and wavelet paths are independent and release the GIL: run them concurrently
+    dct_result, wavelet_result = await asyncio.gather(
+        asyncio.to_thread(dct_compress, img_array, quality),
+        asyncio.to_thread(wavelet_compress, img_array, wavelet, levels, threshold)
+    )
     
     # Metrics
-    mse_dct = np.mean((img_array - dct_result) ** 2)
-    mse_wav = np.mean((img_array - wavelet_result) ** 2)
+    mse_dct = np.mean((img_array - dct_result) ** 2, dtype=np.float64)
+    mse_wav = np.mean((img_array - wavelet_result) ** 2, dtype=np.float64)
     psnr_dct = 10 * np.log10(255**2 / mse_dct) if mse_dct > 0 else float('inf')
     psnr_wav = 10 * np.log10(255**2 / mse_wav) if mse_wav > 0 else float('inf')
     
+    dct_b64, wavelet_b64 = await encode_display_images([dct_result, wavelet_result])
+    
     return {
         "success": True,
         "image_id": image_id,
-        "original": image_to_base64(normalize_for_display(img_array)),
-        "dct_result": image_to_base64(normalize_for_display(dct_result)),
-        "wavelet_result": image_to_base64(normalize_for_display(wavelet_result)),
+        "original": original_b64(image_id),
+        "dct_result": dct_b64,
+        "wavelet_result": wavelet_b64,
         "quality": quality,
         "metrics": {
             "dct": {"mse": float(mse_dct), "psnr": float(psnr_dct)},
@@ -1179,56 +1443,52 @@ async def denoise_sample_image(
     noise_sigma: float = 25
 ):
     """Denoise a sample image without upload"""
-    img_path = TEST_IMAGES_DIR / f"{image_id}.png"
-    if not img_path.exists():
-        raise HTTPException(status_code=404, detail=f"Image {image_id} not found")
-    
-    img = Image.open(img_path).convert('L')
-    img_array = np.array(img, dtype=np.float64)
-    original = img_array.copy()
+    img_array, _ = get_cached_sample(image_id)
+    original = img_array  # cached and read-only: adding noise creates a new array
     
     # Add noise if requested
     if add_noise:
         np.random.seed(42)
-        noise = np.random.normal(0, noise_sigma, img_array.shape)
+        noise = np.random.normal(0, noise_sigma, img_array.shape).astype(np.float32)
         img_array = np.clip(img_array + noise, 0, 255)
     
-    # Decompose
-    coeffs = pywt.wavedec2(img_array, wavelet, level=levels)
+    # Decompose (pywt releases the GIL; keep the event loop free)
+    coeffs = await asyncio.to_thread(
+        pywt.wavedec2, img_array, get_wavelet(wavelet),
+        level=useful_levels(img_array.shape, wavelet, levels)
+    )
     
     # Estimate noise and compute threshold if not provided
     hh = coeffs[-1][2]  # Finest HH
-    sigma = np.median(np.abs(hh)) / 0.6745
+    sigma = estimate_noise_sigma(hh)
     if threshold is None:
         threshold = sigma * np.sqrt(2 * np.log(img_array.size))
     
-    # Threshold detail coefficients
-    thresholded = [coeffs[0]]
-    for lh, hl, hh in coeffs[1:]:
-        thresholded.append((
-            pywt.threshold(lh, threshold, mode=mode),
-            pywt.threshold(hl, threshold, mode=mode),
-            pywt.threshold(hh, threshold, mode=mode)
-        ))
+    # Threshold detail coefficients (fused, in place)
+    thresholded = await asyncio.to_thread(threshold_details, coeffs, threshold, mode)
     
     # Reconstruct
-    denoised = pywt.waverec2(thresholded, wavelet)
+    denoised = await asyncio.to_thread(pywt.waverec2, thresholded, get_wavelet(wavelet))
     denoised = np.clip(denoised[:img_array.shape[0], :img_array.shape[1]], 0, 255)
     
     # Calculate metrics
     if add_noise:
-        snr_before = 10 * np.log10(np.mean(original**2) / np.mean((original - img_array)**2))
-        snr_after = 10 * np.log10(np.mean(original**2) / np.mean((original - denoised)**2))
+        signal_power = np.mean(original**2, dtype=np.float64)
+        snr_before = 10 * np.log10(signal_power / np.mean((original - img_array)**2, dtype=np.float64))
+        snr_after = 10 * np.log10(signal_power / np.mean((original - denoised)**2, dtype=np.float64))
     else:
         snr_before = None
         snr_after = None
     
+    # Encode the denoised (and noisy) images concurrently off the event loop
+    denoised_b64, *noisy = await encode_display_images([denoised] + ([img_array] if add_noise else []))
+    
     return {
         "success": True,
         "image_id": image_id,
-        "original": image_to_base64(normalize_for_display(original)),
-        "noisy": image_to_base64(normalize_for_display(img_array)) if add_noise else None,
-        "denoised": image_to_base64(normalize_for_display(denoised)),
+        "original": original_b64(image_id),
+        "noisy": noisy[0] if add_noise else None,
+        "denoised": denoised_b64,
         "estimated_sigma": float(sigma),
         "threshold_used": float(threshold),
         "snr_before": float(snr_before) if snr_before else None,
@@ -1242,79 +1502,110 @@ async def denoise_sample_image(
 # ============================================================================
 
 # Predefined kernels
+# "type" picks the resize rule: blur_box | blur_gauss | edge | other (interpolated)
+# "separable" holds the (column, row) 1-D factors of rank-1 kernels
 KERNELS = {
     "identity": {
         "name": "Identity",
         "description": "No change - passes through the original image",
+        "type": "blur_gauss",
         "matrix": [[0, 0, 0], [0, 1, 0], [0, 0, 0]]
     },
     "blur_box": {
         "name": "Box Blur",
         "description": "Simple averaging blur - each pixel becomes average of neighbors",
-        "matrix": [[1/9, 1/9, 1/9], [1/9, 1/9, 1/9], [1/9, 1/9, 1/9]]
+        "type": "blur_box",
+        "matrix": [[1/9, 1/9, 1/9], [1/9, 1/9, 1/9], [1/9, 1/9, 1/9]],
+        "separable": ([1/3, 1/3, 1/3], [1/3, 1/3, 1/3])
     },
     "blur_gaussian": {
         "name": "Gaussian Blur",
         "description": "Weighted blur - center pixels have more influence (σ≈1)",
-        "matrix": [[1/16, 2/16, 1/16], [2/16, 4/16, 2/16], [1/16, 2/16, 1/16]]
+        "type": "blur_gauss",
+        "matrix": [[1/16, 2/16, 1/16], [2/16, 4/16, 2/16], [1/16, 2/16, 1/16]],
+        "separable": ([1/4, 2/4, 1/4], [1/4, 2/4, 1/4])
     },
     "sharpen": {
         "name": "Sharpen",
         "description": "Enhances edges by amplifying differences from neighbors",
+        "type": "blur_gauss",
         "matrix": [[0, -1, 0], [-1, 5, -1], [0, -1, 0]]
     },
     "sharpen_strong": {
         "name": "Strong Sharpen",
         "description": "More aggressive sharpening with diagonal neighbors",
+        "type": "blur_gauss",
         "matrix": [[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]]
     },
     "edge_laplacian": {
         "name": "Laplacian Edge",
         "description": "Detects edges in all directions using second derivative",
+        "type": "edge",
         "matrix": [[0, -1, 0], [-1, 4, -1], [0, -1, 0]]
     },
     "edge_laplacian_diag": {
         "name": "Laplacian (Diagonal)",
         "description": "Laplacian including diagonal neighbors",
+        "type": "edge",
         "matrix": [[-1, -1, -1], [-1, 8, -1], [-1, -1, -1]]
     },
     "edge_sobel_x": {
         "name": "Sobel X (Vertical edges)",
         "description": "Detects vertical edges using horizontal gradient",
-        "matrix": [[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]]
+        "type": "edge",
+        "matrix": [[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]],
+        "separable": ([1, 2, 1], [-1, 0, 1])
     },
     "edge_sobel_y": {
         "name": "Sobel Y (Horizontal edges)",
         "description": "Detects horizontal edges using vertical gradient",
-        "matrix": [[-1, -2, -1], [0, 0, 0], [1, 2, 1]]
+        "type": "edge",
+        "matrix": [[-1, -2, -1], [0, 0, 0], [1, 2, 1]],
+        "separable": ([-1, 0, 1], [1, 2, 1])
     },
     "edge_prewitt_x": {
         "name": "Prewitt X",
         "description": "Simpler vertical edge detection",
-        "matrix": [[-1, 0, 1], [-1, 0, 1], [-1, 0, 1]]
+        "type": "edge",
+        "matrix": [[-1, 0, 1], [-1, 0, 1], [-1, 0, 1]],
+        "separable": ([1, 1, 1], [-1, 0, 1])
     },
     "edge_prewitt_y": {
         "name": "Prewitt Y",
         "description": "Simpler horizontal edge detection",
-        "matrix": [[-1, -1, -1], [0, 0, 0], [1, 1, 1]]
+        "type": "edge",
+        "matrix": [[-1, -1, -1], [0, 0, 0], [1, 1, 1]],
+        "separable": ([-1, 0, 1], [1, 1, 1])
     },
     "emboss": {
         "name": "Emboss",
         "description": "Creates 3D shadow effect - highlights edges with direction",
+        "type": "blur_gauss",
         "matrix": [[-2, -1, 0], [-1, 1, 1], [0, 1, 2]]
     },
     "emboss_strong": {
         "name": "Strong Emboss",
         "description": "More pronounced emboss effect",
+        "type": "edge",
         "matrix": [[-2, -2, 0], [-2, 6, 0], [0, 0, 0]]
     },
     "outline": {
         "name": "Outline",
         "description": "Extracts object outlines",
+        "type": "edge",
         "matrix": [[-1, -1, -1], [-1, 8, -1], [-1, -1, -1]]
     }
 }
 
+# kernel_id -> (float32 matrix, is_edge), built once instead of per request
+KERNEL_ARRAYS = {
+    kernel_id: (
+        np.asarray(kernel["matrix"], dtype=np.float32),
+        'edge' in kernel_id or 'laplacian' in kernel_id or kernel_id == 'outline'
+    )
+    for kernel_id, kernel in KERNELS.items()
+}
+
 
 @app.get("/api/kernels")
 async def list_kernels():
@@ -1356,77 +1647,69 @@ async def apply_kernel_to_image(
     Strength interpolates between original (0) and full kernel effect (1+).
     kernel_size: 3, 4, or 5 - will resize kernel accordingly
     """
-    from scipy.ndimage import convolve
+    from scipy.ndimage import convolve, convolve1d
     
     # Validate kernel
     if kernel_id not in KERNELS:
         raise HTTPException(status_code=404, detail=f"Kernel {kernel_id} not found")
     
-    # Load image
-    img_path = TEST_IMAGES_DIR / f"{image_id}.png"
-    if not img_path.exists():
-        raise HTTPException(status_code=404, detail=f"Image {image_id} not found")
-    
-    # Load as color or grayscale
+    # Load as color or grayscale (decoded once at startup)
     if grayscale:
-        img = Image.open(img_path).convert('L')
-        img_array = np.array(img, dtype=np.float64)
+        img_array, _ = get_cached_sample(image_id)
         is_color = False
     else:
-        img = Image.open(img_path).convert('RGB')
-        img_array = np.array(img, dtype=np.float64)
+        img_array = get_cached_sample_rgb(image_id)[0].astype(np.float32)
         is_color = True
     
     # Get kernel matrix and resize if needed
     kernel_data = KERNELS[kernel_id]
-    base_matrix = np.array(kernel_data["matrix"], dtype=np.float64)
+    base_matrix, is_edge = KERNEL_ARRAYS[kernel_id]
     
     # Resize kernel if requested
     if kernel_size != 3:
-        kernel_matrix = resize_kernel(base_matrix, kernel_size)
+        kernel_matrix = resize_kernel(base_matrix, kernel_data["type"], kernel_size)
     else:
         kernel_matrix = base_matrix
     
-    # Apply convolution
-    if is_color:
-        # Apply to each channel
-        result_channels = []
-        for c in range(3):
-            convolved = convolve(img_array[:,:,c], kernel_matrix, mode='reflect')
-            
-            # For edge detection kernels, take absolute value and normalize
-            if 'edge' in kernel_id or 'laplacian' in kernel_id or kernel_id == 'outline':
-                convolved = np.abs(convolved)
-                if convolved.max() > 0:
-                    convolved = convolved / convolved.max() * 255
-            
-            # Interpolate with original based on strength
-            if strength != 1.0:
-                channel_result = img_array[:,:,c] * (1 - strength) + convolved * strength
-            else:
-                channel_result = convolved
-            
-            result_channels.append(np.clip(channel_result, 0, 255))
+    # Rank-1 kernels run as two 1-D passes (2k instead of k*k taps per pixel)
+    if "separable" in kernel_data:
+        col, row = resize_separable(*kernel_data["separable"], kernel_data["type"], kernel_size)
         
-        result = np.stack(result_channels, axis=2).astype(np.uint8)
-        original_display = img_array.astype(np.uint8)
+        def apply_kernel(channel):
+            return convolve1d(convolve1d(channel, col, axis=0, mode='reflect'), row, axis=1, mode='reflect')
     else:
-        convolved = convolve(img_array, kernel_matrix, mode='reflect')
+        def apply_kernel(channel):
+            return convolve(channel, kernel_matrix, mode='reflect')
+    
+    def filter_channel(channel):
+        convolved = apply_kernel(channel)
         
         # For edge detection kernels, take absolute value and normalize
-        if 'edge' in kernel_id or 'laplacian' in kernel_id or kernel_id == 'outline':
+        if is_edge:
             convolved = np.abs(convolved)
             if convolved.max() > 0:
                 convolved = convolved / convolved.max() * 255
         
         # Interpolate with original based on strength
         if strength != 1.0:
-            result = img_array * (1 - strength) + convolved * strength
+            channel_result = channel * (1 - strength) + convolved * strength
         else:
-            result = convolved
+            channel_result = convolved
+        
+        return np.clip(channel_result, 0, 255)
+    
+    # Apply convolution (channels are independent and ndimage releases the GIL)
+    loop = asyncio.get_running_loop()
+    if is_color:
+        # Apply to each channel concurrently
+        result_channels = await asyncio.gather(*(
+            loop.run_in_executor(_WORKER_POOL, filter_channel, img_array[:,:,c]) for c in range(3)
+        ))
         
-        result = np.clip(result, 0, 255).astype(np.uint8)
-        original_display = normalize_for_display(img_array)
+        result = np.stack(result_channels, axis=2).astype(np.uint8)
+    else:
+        result = await loop.run_in_executor(_WORKER_POOL, filter_channel, img_array)
+        result = result.astype(np.uint8)
     
     return {
         "success": True,
@@ -1437,51 +1720,46 @@ async def apply_kernel_to_image(
         "kernel_size": kernel_size,
         "strength": strength,
         "is_color": is_color,
-        "original": image_to_base64(original_display),
-        "result": image_to_base64(result),
+        "original": original_b64(image_id, "RGB" if is_color else "L"),
+        "result": await asyncio.to_thread(image_to_base64, result),
         "shape": list(img_array.shape)
     }
 
 
-def resize_kernel(kernel: np.ndarray, new_size: int) -> np.ndarray:
+@lru_cache(maxsize=16)
+def _gaussian_1d(size: int) -> np.ndarray:
+    """Normalized 1-D gaussian (sigma = size / 3) used to enlarge Gaussian blurs"""
+    sigma = size / 3.0
+    ax = np.linspace(-(size - 1) / 2., (size - 1) / 2., size)
+    gauss = np.exp(-0.5 * np.square(ax) / np.square(sigma))
+    gauss /= gauss.sum()
+    gauss.setflags(write=False)
+    return gauss
+
+
+def _edge_taps(new_size: int) -> list:
+    """Positions of the 3 original taps when an edge kernel is spread to new_size"""
+    return [int(i * (new_size - 1) / 2) for i in range(3)]
+
+
+def resize_kernel(kernel: np.ndarray, kernel_type: str, new_size: int) -> np.ndarray:
     """Resize a 3x3 kernel to a larger size while preserving behavior"""
     if new_size == 3:
         return kernel
     
-    # For blur kernels, create uniform or gaussian distribution
-    center_val = kernel[1, 1]
-    edge_val = kernel[0, 1] if kernel[0, 1] != 0 else kernel[1, 0]
-    corner_val = kernel[0, 0]
-    
-    # Check if it's an averaging kernel (blur)
-    is_blur = np.allclose(kernel.sum(), 1.0)
-    
-    # Check if it's an edge detection kernel
-    is_edge = np.allclose(kernel.sum(), 0.0)
-    
-    if is_blur:
-        # Create larger blur kernel
-        if np.allclose(kernel, kernel[0, 0]):  # Box blur
-            return np.ones((new_size, new_size)) / (new_size * new_size)
-        else:  # Gaussian-like
-            from scipy.ndimage import zoom
-            sigma = new_size / 3.0
-            ax = np.linspace(-(new_size - 1) / 2., (new_size - 1) / 2., new_size)
-            gauss = np.exp(-0.5 * np.square(ax) / np.square(sigma))
-            kernel_2d = np.outer(gauss, gauss)
-            return kernel_2d / kernel_2d.sum()
-    elif is_edge:
+    if kernel_type == "blur_box":
+        return np.ones((new_size, new_size)) / (new_size * new_size)
+    elif kernel_type == "blur_gauss":
+        gauss = _gaussian_1d(new_size)
+        return np.outer(gauss, gauss)
+    elif kernel_type == "edge":
         # Scale edge detection kernel
         new_kernel = np.zeros((new_size, new_size))
         center = new_size // 2
         
         # Copy pattern from 3x3 kernel scaled
-        for i in range(3):
-            for j in range(3):
-                # Map 3x3 positions to larger kernel
-                ni = int(i * (new_size - 1) / 2)
-                nj = int(j * (new_size - 1) / 2)
-                new_kernel[ni, nj] = kernel[i, j]
+        taps = _edge_taps(new_size)
+        new_kernel[np.ix_(taps, taps)] = kernel
         
         # Fill center
         new_kernel[center, center] = -new_kernel.sum() + kernel[1, 1]
@@ -1496,6 +1774,51 @@ def resize_kernel(kernel: np.ndarray, new_size: int) -> np.ndarray:
         return new_kernel
 
 
+def resize_separable(col, row, kernel_type: str, new_size: int) -> tuple:
+    """1-D factors of resize_kernel(np.outer(col, row), kernel_type, new_size)"""
+    col = np.asarray(col, dtype=np.float32)
+    row = np.asarray(row, dtype=np.float32)
+    if new_size == 3:
+        return col, row
+    
+    if kernel_type == "blur_box":
+        box = np.full(new_size, 1.0 / new_size)
+        return box, box
+    if kernel_type == "blur_gauss":
+        return _gaussian_1d(new_size), _gaussian_1d(new_size)
+    
+    # Edge: scatter the 3 taps onto the larger grid, as resize_kernel does
+    taps = _edge_taps(new_size)
+    new_col, new_row = np.zeros(new_size), np.zeros(new_size)
+    new_col[taps] = col
+    new_row[taps] = row
+    return new_col, new_row
+
+
+def convolve3x3(img: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """3x3 convolution with reflect borders as a sum of shifted slices (zero taps are skipped)"""
+    h, w = img.shape
+    padded = np.pad(img, 1, mode='symmetric')  # == ndimage mode='reflect'
+    out = np.zeros_like(img)
+    tap = np.empty_like(img)
+    # Convolution flips the kernel: output[y, x] += kernel[2-i, 2-j] * padded[y+i, x+j]
+    for i in range(3):
+        for j in range(3):
+            weight = kernel[2 - i, 2 - j]
+            if weight == 0:
+                continue
+            np.multiply(padded[i:i + h, j:j + w], weight.astype(img.dtype), out=tap)
+            out += tap
+    return out
+
+
+def _apply_custom(img_array: np.ndarray, kernel_matrix: np.ndarray) -> str:
+    """Convolve, clip and encode a custom-kernel result (runs in a worker thread)"""
+    result = convolve3x3(img_array, kernel_matrix)
+    np.clip(result, 0, 255, out=result)
+    return display_base64(result)
+
+
 @app.get("/api/kernels/apply-custom/{image_id}")
 async def apply_custom_kernel(
     image_id: str,
@@ -1504,15 +1827,8 @@ async def apply_custom_kernel(
     k20: float = 0, k21: float = 0, k22: float = 0
 ):
     """Apply a custom 3x3 kernel to an image"""
-    from scipy.ndimage import convolve
-    
     # Load image
-    img_path = TEST_IMAGES_DIR / f"{image_id}.png"
-    if not img_path.exists():
-        raise HTTPException(status_code=404, detail=f"Image {image_id} not found")
-    
-    img = Image.open(img_path).convert('L')
-    img_array = np.array(img, dtype=np.float64)
+    img_array, _ = get_cached_sample(image_id)
     
     # Build kernel from parameters
     kernel_matrix = np.array([
@@ -1521,16 +1837,15 @@ async def apply_custom_kernel(
         [k20, k21, k22]
     ], dtype=np.float64)
     
-    # Apply convolution
-    result = convolve(img_array, kernel_matrix, mode='reflect')
-    result = np.clip(result, 0, 255)
+    # Apply convolution, clip and encode off the event loop
+    result_b64 = await asyncio.to_thread(_apply_custom, img_array, kernel_matrix)
     
     return {
         "success": True,
         "image_id": image_id,
         "kernel_matrix": kernel_matrix.tolist(),
-        "original": image_to_base64(normalize_for_display(img_array)),
-        "result": image_to_base64(normalize_for_display(result)),
+        "original": original_b64(image_id),
+        "result": result_b64,
         "shape": list(img_array.shape)
     }
 
@@ -34,6 +34,18 @@ const BASE_KERNELS = {
   }
 }
 
+// Decode base64 RGB bytes from /sprite-images/{id}/pixels into [row][col][rgb]
+function decodeSpritePixels({ pixels_b64, shape }) {
+  const bytes = Uint8Array.from(atob(pixels_b64), c => c.charCodeAt(0))
+  const [height, width, channels] = shape
+  return Array.from({ length: height }, (_, i) =>
+    Array.from({ length: width }, (_, j) => {
+      const k = (i * width + j) * channels
+      return Array.from(bytes.subarray(k, k + channels))
+    })
+  )
+}
+
 // Generate kernel matrix for given size
 function generateKernel(kernelId, size) {
   const center = Math.floor(size / 2)
@@ -172,7 +184,7 @@ export default function KernelsEducationalView({ api, compact = false }) {
     const loadPixels = async () => {
       try {
         const response = await axios.get(`${api}/sprite-images/${selectedSprite}/pixels`)
-        setPixelData(response.data)
+        setPixelData({ ...response.data, pixels: decodeSpritePixels(response.data) })
         // Initialize output with zeros
         const size = response.data.size
         setOutputPixels(Array(size).fill(null).map(() => 
@@ -182,8 +182,8 @@ export default function SignalDemoView({ api }) {
               <strong>Approximation (low freq):</strong> {data.coefficients.approximation.length} samples
             </p>
             <p>
-              <strong>Detail levels:</strong> {data.coefficients.details.map((d, i) => 
-                `D${i + 1}: ${d.length}`
+              <strong>Detail levels:</strong> {data.coefficients.details_offsets.slice(1).map((end, i) => 
+                `D${i + 1}: ${end - data.coefficients.details_offsets[i]}`
               ).join(', ')}
             </p>
           </div>
@@ -6,16 +6,33 @@ by decomposing it using 2D FFT and showing the magnitude spectrum.
 Also shows the 2D DCT basis functions that make up any 8x8 block.
 """
 
+import os
 import numpy as np
 import matplotlib.pyplot as plt
 from PIL import Image
 from pathlib import Path
-from scipy.fftpack import dct, idct
+from functools import lru_cache
+from typing import Optional
+from scipy.fft import fft2, rfft2, irfft2
 
-# Path to test images (relative to scripts/ -> prezentare_wavelet -> data)
-IMAGES_DIR = Path(__file__).parent.parent / "data" / "standard_test_images"
+# Path to test images (relative to scripts/ -> prezentare_wavelet -> data),
+# resolved once to an absolute string so load_image does no Path arithmetic
+IMAGES_DIR = str((Path(__file__).parent.parent / "data" / "standard_test_images").resolve())
 
+# Zigzag order for 8x8, as (u, v) index pairs
+ZIGZAG = np.array([
+    (0,0), (0,1), (1,0), (2,0), (1,1), (0,2), (0,3), (1,2),
+    (2,1), (3,0), (4,0), (3,1), (2,2), (1,3), (0,4), (0,5),
+    (1,4), (2,3), (3,2), (4,1), (5,0), (6,0), (5,1), (4,2),
+    (3,3), (2,4), (1,5), (0,6), (0,7), (1,6), (2,5), (3,4),
+    (4,3), (5,2), (6,1), (7,0), (7,1), (6,2), (5,3), (4,4),
+    (3,5), (2,6), (1,7), (2,7), (3,6), (4,5), (5,4), (6,3),
+    (7,2), (7,3), (6,4), (5,5), (4,6), (3,7), (4,7), (5,6),
+    (6,5), (7,4), (7,5), (6,6), (5,7), (6,7), (7,6), (7,7)
+], dtype=np.int8)
 
+
+@lru_cache(maxsize=8)
 def generate_dct_basis(N: int = 8) -> np.ndarray:
     """
     Generate all N×N 2D DCT basis functions.
@@ -27,23 +44,33 @@ def generate_dct_basis(N: int = 8) -> np.ndarray:
     
     Returns:
         basis: Array of shape (N, N, N, N) where basis[u, v] is the (u,v) basis image
+               (cached per N and read-only; copy before modifying)
     """
-    basis = np.zeros((N, N, N, N))
+    # 1D DCT-II cosine table: C[u, x] = cos((2x + 1) * u * pi / (2N))
+    n = np.arange(N)
+    C = np.cos((2*n[None, :] + 1) * n[:, None] * np.pi / (2*N))
     
-    for u in range(N):
-        for v in range(N):
-            # Create basis function for frequency (u, v)
-            for x in range(N):
-                for y in range(N):
-                    # DCT-II basis function formula
-                    basis[u, v, x, y] = (
-                        np.cos((2*x + 1) * u * np.pi / (2*N)) *
-                        np.cos((2*y + 1) * v * np.pi / (2*N))
-                    )
+    # The 2D basis is separable: basis[u, v, x, y] = C[u, x] * C[v, y]
+    basis = np.einsum('ux,vy->uvxy', C, C).astype(np.float32)
+    basis.setflags(write=False)
     
     return basis
 
 
+@lru_cache(maxsize=8)
+def dct_matrix(N: int = 8) -> np.ndarray:
+    """
+    Orthonormal N×N DCT-II matrix C, so that the 2D DCT of a block B is C @ B @ C.T
+    (same result as dctn(B, norm='ortho')). Cached per N and read-only.
+    """
+    n = np.arange(N)
+    C = np.cos(np.pi * (2*n[None, :] + 1) * n[:, None] / (2*N)) * np.sqrt(2 / N)
+    C[0] /= np.sqrt(2)
+    C = C.astype(np.float32)
+    C.setflags(write=False)
+    return C
+
+
 def visualize_dct_basis(N: int = 8):
     """
     Visualize the NxN DCT basis functions as a grid.
@@ -85,17 +112,15 @@ def decompose_block_into_basis(block: np.ndarray, N: int = 8):
         coefficients: DCT coefficients
         weighted_basis: Each basis function scaled by its coefficient
     """
-    # Compute 2D DCT
-    coefficients = dct(dct(block.T, norm='ortho').T, norm='ortho')
+    # Compute 2D DCT as two small matmuls with the cached DCT matrix
+    C = dct_matrix(N)
+    coefficients = C @ block @ C.T
     
     # Get basis functions
     basis = generate_dct_basis(N)
     
-    # Weight each basis by its coefficient
-    weighted_basis = np.zeros((N, N, N, N))
-    for u in range(N):
-        for v in range(N):
-            weighted_basis[u, v] = coefficients[u, v] * basis[u, v]
+    # Weight each basis by its coefficient (broadcast over the N×N basis images)
+    weighted_basis = coefficients[:, :, None, None] * basis
     
     return coefficients, weighted_basis
 
@@ -139,16 +164,17 @@ def visualize_block_decomposition(image: np.ndarray, block_x: int = 0, block_y:
     # Create a composite image showing all weighted basis
     # Arrange in a grid with small gaps
     gap = 1
-    composite = np.ones(((N + gap) * N - gap, (N + gap) * N - gap)) * 0.5  # gray background
     
-    for u in range(N):
-        for v in range(N):
-            wb = weighted_basis[u, v]
-            # Normalize for display
-            wb_norm = (wb - wb.min()) / (wb.max() - wb.min() + 1e-10)
-            y_pos = u * (N + gap)
-            x_pos = v * (N + gap)
-            composite[y_pos:y_pos+N, x_pos:x_pos+N] = wb_norm
+    # Normalize every tile to [0, 1] at once (per-tile min/max over the last two axes)
+    wb_min = weighted_basis.min(axis=(2, 3), keepdims=True)
+    wb_max = weighted_basis.max(axis=(2, 3), keepdims=True)
+    wb_norm = (weighted_basis - wb_min) / (wb_max - wb_min + 1e-10)
+    
+    # Pad each tile with the gray gap on its right/bottom, interleave tile rows with
+    # pixel rows (u, x, v, y), and drop the trailing gap
+    padded = np.pad(wb_norm, ((0, 0), (0, 0), (0, gap), (0, gap)), constant_values=0.5)
+    size = N * (N + gap)
+    composite = padded.transpose(0, 2, 1, 3).reshape(size, size)[:size - gap, :size - gap]
     
     ax_basis.imshow(composite, cmap='gray', interpolation='nearest')
     ax_basis.set_title("Weighted Basis Functions\n(coefficient × basis)", fontsize=12)
@@ -170,20 +196,19 @@ def visualize_progressive_basis_reconstruction(image: np.ndarray, block_x: int =
     block_shifted = block - 128
     
     # Compute DCT
-    coefficients = dct(dct(block_shifted.T, norm='ortho').T, norm='ortho')
+    C = dct_matrix(N)
+    coefficients = C @ block_shifted @ C.T
     basis = generate_dct_basis(N)
     
-    # Zigzag order for 8x8
-    zigzag_order = [
-        (0,0), (0,1), (1,0), (2,0), (1,1), (0,2), (0,3), (1,2),
-        (2,1), (3,0), (4,0), (3,1), (2,2), (1,3), (0,4), (0,5),
-        (1,4), (2,3), (3,2), (4,1), (5,0), (6,0), (5,1), (4,2),
-        (3,3), (2,4), (1,5), (0,6), (0,7), (1,6), (2,5), (3,4),
-        (4,3), (5,2), (6,1), (7,0), (7,1), (6,2), (5,3), (4,4),
-        (3,5), (2,6), (1,7), (2,7), (3,6), (4,5), (5,4), (6,3),
-        (7,2), (7,3), (6,4), (5,5), (4,6), (3,7), (4,7), (5,6),
-        (6,5), (7,4), (7,5), (6,6), (5,7), (6,7), (7,6), (7,7)
-    ]
+    # Weighted basis functions in zigzag order; their running sum gives every
+    # partial reconstruction at once (cumulative[k] uses the first k+1 coefficients)
+    us, vs = ZIGZAG[:, 0], ZIGZAG[:, 1]
+    weighted = coefficients[us, vs, None, None] * basis[us, vs]
+    cumulative = np.cumsum(weighted, axis=0)
+    
+    # Zigzag rank of each coefficient position, for the "used coefficients" masks
+    rank = np.empty((N, N), dtype=int)
+    rank[us, vs] = np.arange(len(ZIGZAG))
     
     # Show reconstruction at different stages
     stages = [1, 3, 6, 10, 15, 21, 36, 64]  # Number of coefficients to include
@@ -193,14 +218,8 @@ def visualize_progressive_basis_reconstruction(image: np.ndarray, block_x: int =
                  fontsize=14, fontweight='bold')
     
     for idx, num_coef in enumerate(stages):
-        # Reconstruct with first num_coef coefficients
-        reconstruction = np.zeros((N, N))
-        for i in range(min(num_coef, len(zigzag_order))):
-            u, v = zigzag_order[i]
-            reconstruction += coefficients[u, v] * basis[u, v]
-        
-        # Add back the 128 offset
-        reconstruction += 128
+        # Reconstruct with first num_coef coefficients, adding back the 128 offset
+        reconstruction = cumulative[min(num_coef, len(ZIGZAG)) - 1] + 128
         
         # Show reconstruction
         axes[0, idx].imshow(reconstruction, cmap='gray', vmin=0, vmax=255, interpolation='nearest')
@@ -208,10 +227,7 @@ def visualize_progressive_basis_reconstruction(image: np.ndarray, block_x: int =
         axes[0, idx].axis('off')
         
         # Show which coefficients are included
-        mask = np.zeros((N, N))
-        for i in range(min(num_coef, len(zigzag_order))):
-            u, v = zigzag_order[i]
-            mask[u, v] = 1
+        mask = (rank < num_coef).astype(np.float32)
         axes[1, idx].imshow(mask, cmap='Blues', interpolation='nearest', vmin=0, vmax=1)
         axes[1, idx].set_title("Used coeffs")
         axes[1, idx].axis('off')
@@ -221,10 +237,10 @@ def visualize_progressive_basis_reconstruction(image: np.ndarray, block_x: int =
 
 
 def load_image(name: str = "baboon_512.png") -> np.ndarray:
-    """Load an image as grayscale numpy array"""
-    img_path = IMAGES_DIR / name
+    """Load an image as grayscale float32 numpy array (plenty for 256 gray levels)"""
+    img_path = os.path.join(IMAGES_DIR, name)
     img = Image.open(img_path).convert('L')
-    return np.array(img, dtype=np.float64)
+    return np.array(img, dtype=np.float32)
 
 
 def compute_fft(image: np.ndarray) -> tuple:
@@ -236,8 +252,8 @@ def compute_fft(image: np.ndarray) -> tuple:
         magnitude: Log-scaled magnitude spectrum for visualization
         phase: Phase spectrum
     """
-    # 2D FFT
-    fft = np.fft.fft2(image)
+    # 2D FFT (multithreaded pocketfft)
+    fft = fft2(image, workers=-1)
     
     # Shift zero frequency to center
     fft_shifted = np.fft.fftshift(fft)
@@ -251,17 +267,26 @@ def compute_fft(image: np.ndarray) -> tuple:
     return fft_shifted, magnitude, phase
 
 
-def create_frequency_mask(shape: tuple, freq_range: tuple, mask_type: str = "band") -> np.ndarray:
+def compute_rfft(image: np.ndarray) -> np.ndarray:
     """
-    Create a frequency mask for filtering.
-    
-    Args:
-        shape: Image shape (height, width)
-        freq_range: (low, high) frequency range as fraction of max frequency (0-1)
-        mask_type: "low", "high", or "band"
+    Half-spectrum 2D FFT of a real image, used for reconstructions.
     
-    Returns:
-        mask: Binary mask array
+    A real image has a Hermitian-symmetric spectrum, so rfft2's W//2 + 1
+    columns determine it completely at half the memory traffic of fft2.
+    """
+    return rfft2(image, workers=-1)
+
+
+def to_rfft_layout(mask: np.ndarray) -> np.ndarray:
+    """Convert a centered full-size frequency mask to the (unshifted) rfft2 half layout"""
+    return np.fft.ifftshift(mask)[:, :mask.shape[1] // 2 + 1]
+
+
+@lru_cache(maxsize=4)
+def frequency_distance(shape: tuple) -> np.ndarray:
+    """
+    Distance of every (shifted) frequency bin from the center, normalized so
+    that half the diagonal is 1. Cached per shape and read-only.
     """
     rows, cols = shape
     center_row, center_col = rows // 2, cols // 2
@@ -273,6 +298,23 @@ def create_frequency_mask(shape: tuple, freq_range: tuple, mask_type: str = "ban
     # Normalize distance (max distance is half the diagonal)
     max_dist = np.sqrt(center_row**2 + center_col**2)
     distance_norm = distance / max_dist
+    distance_norm.setflags(write=False)
+    return distance_norm
+
+
+def create_frequency_mask(shape: tuple, freq_range: tuple, mask_type: str = "band") -> np.ndarray:
+    """
+    Create a frequency mask for filtering.
+    
+    Args:
+        shape: Image shape (height, width)
+        freq_range: (low, high) frequency range as fraction of max frequency (0-1)
+        mask_type: "low", "high", or "band"
+    
+    Returns:
+        mask: Binary mask array
+    """
+    distance_norm = frequency_distance(shape)
     
     low, high = freq_range
     
@@ -283,50 +325,68 @@ def create_frequency_mask(shape: tuple, freq_range: tuple, mask_type: str = "ban
     else:  # band
         mask = (distance_norm >= low) & (distance_norm <= high)
     
-    return mask.astype(np.float64)
+    return mask.astype(np.float32)
 
 
-def reconstruct_from_frequencies(fft_shifted: np.ndarray, mask: np.ndarray) -> np.ndarray:
+def reconstruct_from_frequencies(spectrum: np.ndarray, mask: np.ndarray,
+                                 scratch: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Reconstruct image from selected frequency components.
     
     Args:
-        fft_shifted: Shifted FFT of original image
-        mask: Frequency mask (1 = keep, 0 = remove)
+        spectrum: Half spectrum of original image (see compute_rfft)
+        mask: Centered frequency mask (1 = keep, 0 = remove), symmetric about
+              the center like the masks from create_frequency_mask
+        scratch: Optional buffer shaped like spectrum, reused across calls
+                 (its contents are overwritten)
     
     Returns:
         Reconstructed image
     """
-    # Apply mask
-    filtered_fft = fft_shifted * mask
+    if scratch is None:
+        scratch = np.empty_like(spectrum)
     
-    # Inverse shift and FFT
-    fft_unshifted = np.fft.ifftshift(filtered_fft)
-    reconstructed = np.fft.ifft2(fft_unshifted)
+    # Apply mask on the half spectrum, in place in the scratch buffer
+    np.multiply(spectrum, to_rfft_layout(mask), out=scratch)
     
-    return np.real(reconstructed)
+    # Inverse real FFT (the result is real by construction); the input is scratch,
+    # so pocketfft may reuse it instead of copying
+    return irfft2(scratch, s=mask.shape, overwrite_x=True, workers=-1)
 
 
-def visualize_frequency_decomposition(image: np.ndarray, num_bands: int = 5):
+def visualize_frequency_decomposition(image: np.ndarray, num_bands: int = 5,
+                                      fft_data: Optional[tuple] = None, spectrum: Optional[np.ndarray] = None):
     """
     Decompose and visualize image by frequency bands.
     
     Shows how different frequency ranges contribute to the image.
+    fft_data (from compute_fft) and spectrum (from compute_rfft) can be passed
+    in to reuse transforms already computed for this image.
     """
-    fft_shifted, magnitude, phase = compute_fft(image)
+    fft_shifted, magnitude, phase = fft_data if fft_data is not None else compute_fft(image)
+    if spectrum is None:
+        spectrum = compute_rfft(image)
+    
+    scratch = np.empty_like(spectrum)
+    
+    # Distance map computed once; each band mask is then just a comparison
+    # (bands are closed intervals, so bins exactly on a boundary ring belong to both)
+    distance_norm = frequency_distance(image.shape)
     
     # Create frequency bands
     bands = []
+    masks = []
     band_labels = []
     
     for i in range(num_bands):
         low = i / num_bands
         high = (i + 1) / num_bands
         
-        mask = create_frequency_mask(image.shape, (low, high), "band")
-        reconstructed = reconstruct_from_frequencies(fft_shifted, mask)
+        mask = ((distance_norm >= low) & (distance_norm <= high)).astype(np.float32)
+        reconstructed = reconstruct_from_frequencies(spectrum, mask, scratch)
         
         bands.append(reconstructed)
+        masks.append(mask)
         if i == 0:
             band_labels.append(f"DC + Very Low\n(0-{high:.0%})")
         elif i == num_bands - 1:
@@ -348,19 +408,15 @@ def visualize_frequency_decomposition(image: np.ndarray, num_bands: int = 5):
     axes[1, 0].axis('off')
     
     # Frequency bands
-    for i, (band, label) in enumerate(zip(bands, band_labels)):
+    for i, (band, mask, label) in enumerate(zip(bands, masks, band_labels)):
         # Show the band contribution
         ax = axes[0, i + 1]
-        # Normalize each band for display
-        band_norm = band - band.min()
-        if band_norm.max() > 0:
-            band_norm = band_norm / band_norm.max() * 255
-        ax.imshow(band_norm, cmap='gray')
+        # imshow autoscales each band to its own min/max (no normalized copy needed)
+        ax.imshow(band, cmap='gray')
         ax.set_title(label)
         ax.axis('off')
         
         # Show the mask
-        mask = create_frequency_mask(image.shape, (i/num_bands, (i+1)/num_bands), "band")
         axes[1, i + 1].imshow(mask, cmap='gray')
         axes[1, i + 1].set_title(f"Mask {i+1}")
         axes[1, i + 1].axis('off')
@@ -369,22 +425,34 @@ def visualize_frequency_decomposition(image: np.ndarray, num_bands: int = 5):
     return fig
 
 
-def visualize_progressive_reconstruction(image: np.ndarray):
+def visualize_progressive_reconstruction(image: np.ndarray, spectrum: Optional[np.ndarray] = None):
     """
     Show progressive reconstruction by adding frequency bands one by one.
+    spectrum (from compute_rfft) can be passed in to reuse it.
     """
-    fft_shifted, magnitude, _ = compute_fft(image)
+    if spectrum is None:
+        spectrum = compute_rfft(image)
     
     num_steps = 6
+    cutoffs = np.arange(1, num_steps + 1) / num_steps
+    
+    # Index of the first low-pass cutoff each frequency bin falls under (bin is in
+    # low-pass i iff shell <= i). Reconstruct every newly added shell in one batched
+    # irfft2; by linearity the running sum over shells gives each low-pass image.
+    shell = np.searchsorted(cutoffs, frequency_distance(image.shape))
+    stacked = np.where(to_rfft_layout(shell) == np.arange(num_steps)[:, None, None], spectrum, 0)
+    parts = irfft2(stacked, s=image.shape, axes=(-2, -1), workers=-1)
+    reconstructions = np.cumsum(parts, axis=0)
+    
     fig, axes = plt.subplots(2, num_steps, figsize=(15, 6))
     fig.suptitle("Progressive Reconstruction: Adding Frequency Bands", fontsize=14, fontweight='bold')
     
     for i in range(num_steps):
         # Cumulative frequency range
-        freq_cutoff = (i + 1) / num_steps
-        mask = create_frequency_mask(image.shape, (0, freq_cutoff), "low")
+        freq_cutoff = cutoffs[i]
+        mask = (shell <= i).astype(np.float32)
         
-        reconstructed = reconstruct_from_frequencies(fft_shifted, mask)
+        reconstructed = reconstructions[i]
         
         # Show reconstruction
         axes[0, i].imshow(reconstructed, cmap='gray', vmin=0, vmax=255)
@@ -400,11 +468,15 @@ def visualize_progressive_reconstruction(image: np.ndarray):
     return fig
 
 
-def visualize_frequency_importance(image: np.ndarray):
+def visualize_frequency_importance(image: np.ndarray, fft_data: Optional[tuple] = None, spectrum: Optional[np.ndarray] = None):
     """
     Show what happens when we remove low vs high frequencies.
+    fft_data (from compute_fft) and spectrum (from compute_rfft) can be passed in to reuse them.
     """
-    fft_shifted, magnitude, _ = compute_fft(image)
+    fft_shifted, magnitude, _ = fft_data if fft_data is not None else compute_fft(image)
+    if spectrum is None:
+        spectrum = compute_rfft(image)
+    scratch = np.empty_like(spectrum)  # shared by the three reconstructions below
     
     fig, axes = plt.subplots(2, 4, figsize=(14, 7))
     fig.suptitle("Frequency Importance: Low vs High Frequencies", fontsize=14, fontweight='bold')
@@ -420,7 +492,7 @@ def visualize_frequency_importance(image: np.ndarray):
     
     # Low frequencies only (structure/brightness)
     low_mask = create_frequency_mask(image.shape, (0, 0.1), "low")
-    low_freq = reconstruct_from_frequencies(fft_shifted, low_mask)
+    low_freq = reconstruct_from_frequencies(spectrum, low_mask, scratch)
     axes[0, 1].imshow(low_freq, cmap='gray', vmin=0, vmax=255)
     axes[0, 1].set_title("Low Freq Only (0-10%)\nStructure & Brightness")
     axes[0, 1].axis('off')
@@ -430,7 +502,7 @@ def visualize_frequency_importance(image: np.ndarray):
     
     # Mid frequencies (main details)
     mid_mask = create_frequency_mask(image.shape, (0, 0.3), "low")
-    mid_freq = reconstruct_from_frequencies(fft_shifted, mid_mask)
+    mid_freq = reconstruct_from_frequencies(spectrum, mid_mask, scratch)
     axes[0, 2].imshow(mid_freq, cmap='gray', vmin=0, vmax=255)
     axes[0, 2].set_title("Low+Mid Freq (0-30%)\nMain Details")
     axes[0, 2].axis('off')
@@ -440,11 +512,9 @@ def visualize_frequency_importance(image: np.ndarray):
     
     # High frequencies only (edges/texture)
     high_mask = create_frequency_mask(image.shape, (0.3, 1.0), "band")
-    high_freq = reconstruct_from_frequencies(fft_shifted, high_mask)
-    # Normalize for display
-    high_freq_norm = high_freq - high_freq.min()
-    high_freq_norm = high_freq_norm / high_freq_norm.max() * 255
-    axes[0, 3].imshow(high_freq_norm, cmap='gray')
+    high_freq = reconstruct_from_frequencies(spectrum, high_mask, scratch)
+    # imshow autoscales to the data min/max, so no normalized copy is needed
+    axes[0, 3].imshow(high_freq, cmap='gray')
     axes[0, 3].set_title("High Freq Only (30-100%)\nEdges & Texture")
     axes[0, 3].axis('off')
     axes[1, 3].imshow(high_mask, cmap='gray')
@@ -473,17 +543,21 @@ def main():
     print("   Adding basis functions one by one in zigzag order")
     fig2 = visualize_progressive_basis_reconstruction(image, block_x=12, block_y=10)
     
+    # Transform the image once and share the spectra across the whole-image figures
+    fft_data = compute_fft(image)
+    spectrum = compute_rfft(image)
+    
     print("\n4. Frequency Band Decomposition (whole image)")
     print("   Shows how different frequency ranges contribute to the image")
-    fig3 = visualize_frequency_decomposition(image, num_bands=5)
+    fig3 = visualize_frequency_decomposition(image, num_bands=5, fft_data=fft_data, spectrum=spectrum)
     
     print("\n5. Progressive Reconstruction (whole image)")
     print("   Shows how the image builds up as we add more frequencies")
-    fig4 = visualize_progressive_reconstruction(image)
+    fig4 = visualize_progressive_reconstruction(image, spectrum=spectrum)
     
     print("\n6. Frequency Importance")
     print("   Shows what low vs high frequencies contain")
-    fig5 = visualize_frequency_importance(image)
+    fig5 = visualize_frequency_importance(image, fft_data=fft_data, spectrum=spectrum)
     
     plt.show()
 
@@ -8,10 +8,18 @@ Usage:
     python presentation_runner.py [--mode notes|interactive|auto]
 """
 import time
+import queue
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
+# Scene list is shared with the render script next to this file
+sys.path.insert(0, str(Path(__file__).parent))
+from render_all_animations import SCENES
+
+ANIMATIONS_DIR = Path(__file__).parent.parent / "animations"
+
 
 # Presentation structure with timing and notes
 PRESENTATION = {
@@ -215,14 +223,72 @@ def run_interactive():
     print("="*70)
 
 
+def prerender_animation(scene_name: str, done: queue.Queue):
+    """
+    Start rendering a Manim scene in the background (no preview window).
+    Completion is reported as (scene_name, returncode) on the `done` queue.
+    """
+    filename = next((f for f, scenes in SCENES if scene_name in scenes), None)
+    if filename is None:
+        return None
+    
+    cmd = ["manim", "-ql", str(ANIMATIONS_DIR / filename), scene_name]
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        print("\n⚠️  manim nu este instalat - animațiile nu pot fi pre-randate")
+        return None
+    
+    print(f"\n⏳ Pre-randare în fundal: {scene_name}")
+    threading.Thread(target=lambda: done.put((scene_name, proc.wait())), daemon=True).start()
+    return proc
+
+
+def wait_for_next_section(seconds: float, done: queue.Queue):
+    """Wait out a section's duration, reporting background renders as they finish"""
+    deadline = time.monotonic() + seconds
+    while (remaining := deadline - time.monotonic()) > 0:
+        try:
+            scene_name, returncode = done.get(timeout=remaining)
+        except queue.Empty:
+            break
+        if returncode == 0:
+            print(f"\n✅ Animație gata: {scene_name}")
+        else:
+            print(f"\n❌ EROARE la randarea {scene_name}")
+
+
 def run_auto():
-    """Automatic mode with timed transitions"""
+    """
+    Automatic mode with timed transitions.
+    
+    Each section's animation starts rendering in the background while the
+    previous section is being presented, so it is ready when needed.
+    """
     print("MODUL AUTOMAT - prezentarea avansează automat")
     
-    for section in PRESENTATION['sections']:
-        print_section_notes(section)
-        print(f"\nUrmătoarea secțiune în {section['duration']} secunde...")
-        time.sleep(section['duration'])
+    sections = PRESENTATION['sections']
+    done = queue.Queue()
+    renders = []
+    
+    # The first section has no previous one to hide its render behind
+    if sections and sections[0].get('animation'):
+        renders.append(prerender_animation(sections[0]['animation'], done))
+    
+    try:
+        for i, section in enumerate(sections):
+            next_section = sections[i + 1] if i + 1 < len(sections) else None
+            if next_section and next_section.get('animation'):
+                renders.append(prerender_animation(next_section['animation'], done))
+            
+            print_section_notes(section)
+            print(f"\nUrmătoarea secțiune în {section['duration']} secunde...")
+            wait_for_next_section(section['duration'], done)
+    finally:
+        # Don't leave renders running if the presentation is interrupted
+        for proc in renders:
+            if proc is not None and proc.poll() is None:
+                proc.terminate()
     
     print("\nPREZENTARE COMPLETĂ!")
 
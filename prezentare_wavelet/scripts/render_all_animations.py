@@ -4,9 +4,12 @@ Render all Manim animations for the presentation.
 Usage:
     python render_all_animations.py [--quality low|medium|high]
 """
+import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import argparse
 
 
@@ -24,26 +27,57 @@ QUALITY_FLAGS = {
     "4k": "-pqk",       # 4K, 60fps
 }
 
+# Keeps the logs of parallel renders from interleaving
+_PRINT_LOCK = threading.Lock()
 
-def render_scene(animation_dir: Path, filename: str, scene_name: str, quality: str):
-    """Render a single Manim scene"""
+
+def render_scene(animation_dir: Path, filename: str, scene_name: str, quality: str,
+                 parallel: bool = False):
+    """
+    Render a single Manim scene.
+    
+    With parallel=True the preview flag is dropped (no window per worker) and
+    manim's output is captured and printed in one block once the render ends.
+    """
     quality_flag = QUALITY_FLAGS.get(quality, "-pql")
+    if parallel:
+        quality_flag = quality_flag.replace("p", "")
     filepath = animation_dir / filename
     
     cmd = ["manim", quality_flag, str(filepath), scene_name]
-    print(f"\n{'='*60}")
-    print(f"Rendering: {filename} -> {scene_name}")
-    print(f"Command: {' '.join(cmd)}")
-    print('='*60)
+    header = (f"\n{'='*60}\n"
+              f"Rendering: {filename} -> {scene_name}\n"
+              f"Command: {' '.join(cmd)}\n"
+              + '='*60)
     
-    result = subprocess.run(cmd, capture_output=False)
+    if parallel:
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        output = result.stdout
+    else:
+        print(header)
+        result = subprocess.run(cmd, capture_output=False)
+        output = None
     
     if result.returncode != 0:
-        print(f"ERROR: Failed to render {scene_name}")
-        return False
+        status = f"ERROR: Failed to render {scene_name}"
+    else:
+        status = f"SUCCESS: {scene_name} rendered"
+    
+    with _PRINT_LOCK:
+        if output is not None:
+            print(header)
+            print(output, end="")
+        print(status)
     
-    print(f"SUCCESS: {scene_name} rendered")
-    return True
+    return result.returncode == 0
+
+
+def _positive_int(value: str) -> int:
+    """argparse type: integer >= 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return number
 
 
 def main():
@@ -58,6 +92,13 @@ def main():
         "--scene", "-s",
         help="Render only a specific scene (e.g., 'FourierVsWavelet')"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=_positive_int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        help="Number of scenes to render in parallel (default: half the CPU cores, "
+             "leaving headroom for Manim's ffmpeg encoders)"
+    )
     args = parser.parse_args()
     
     # Get animation directory
@@ -70,20 +111,25 @@ def main():
     
     print(f"Animation directory: {animation_dir}")
     print(f"Quality: {args.quality}")
+    print(f"Parallel jobs: {args.jobs}")
+    
+    # Skip scenes other than the requested one, if any
+    jobs = [
+        (filename, scene_name)
+        for filename, scene_names in SCENES
+        for scene_name in scene_names
+        if not args.scene or args.scene == scene_name
+    ]
     
-    success_count = 0
-    fail_count = 0
+    # Each scene is an independent manim process; threads just wait on them
+    parallel = args.jobs > 1
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(pool.map(
+            lambda job: render_scene(animation_dir, job[0], job[1], args.quality, parallel), jobs
+        ))
     
-    for filename, scene_names in SCENES:
-        for scene_name in scene_names:
-            # Skip if specific scene requested and this isn't it
-            if args.scene and args.scene != scene_name:
-                continue
-                
-            if render_scene(animation_dir, filename, scene_name, args.quality):
-                success_count += 1
-            else:
-                fail_count += 1
+    success_count = sum(results)
+    fail_count = len(results) - success_count
     
     print(f"\n{'='*60}")
     print(f"SUMMARY: {success_count} succeeded, {fail_count} failed")
@@ -3,12 +3,12 @@ Wavelet Presentation - Core Processing Module
 """
 from .wavelets import DWT2D, IDWT2D, mallat_decompose, mallat_reconstruct
 from .dct import DCT2D, IDCT2D, block_dct, block_idct
-from .denoising import wavelet_denoise, threshold_coeffs
+from .denoising import wavelet_denoise, threshold_coeffs, parallel_threshold_coeffs
 from .metrics import psnr, ssim, snr
 
 __all__ = [
     'DWT2D', 'IDWT2D', 'mallat_decompose', 'mallat_reconstruct',
     'DCT2D', 'IDCT2D', 'block_dct', 'block_idct',
-    'wavelet_denoise', 'threshold_coeffs',
+    'wavelet_denoise', 'threshold_coeffs', 'parallel_threshold_coeffs',
     'psnr', 'ssim', 'snr'
 ]